@@ -6,7 +6,7 @@ from sqlalchemy import pool
 from alembic import context
 
 from frikibot.infrastructure import database
-from frikibot.db.models import pokemon, trainer
+from frikibot.db.models import pokemon, trainer, trainer_stats
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
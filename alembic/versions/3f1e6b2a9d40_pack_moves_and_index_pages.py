@@ -0,0 +1,75 @@
+"""Pack moves and index collection pages
+
+Revision ID: 3f1e6b2a9d40
+Revises: 7a398109b1f2
+Create Date: 2026-10-18 10:12:41.518204
+
+"""
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1e6b2a9d40'
+down_revision: Union[str, Sequence[str], None] = '7a398109b1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows updated per transaction while backfilling, so the bot can keep writing in between
+BACKFILL_BATCH_SIZE = 5000
+
+# Indexes no query uses: collections are only looked up by trainer
+UNUSED_INDEXES = ('name', 'first_type', 'second_type', 'move1', 'move2', 'move3', 'move4', 'nature_name', 'id')
+
+PACK_MOVES = "rtrim(coalesce(move1, '') || ',' || coalesce(move2, '') || ',' || coalesce(move3, '') || ',' || coalesce(move4, ''), ',')"
+
+
+def id_ranges() -> Iterator[tuple[int, int]]:
+    """Yield consecutive (start, end] id ranges covering the pokemon table."""
+    max_id = op.get_bind().execute(sa.text('SELECT max(id) FROM pokemon')).scalar() or 0
+    for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+        yield start, start + BACKFILL_BATCH_SIZE
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('pokemon', sa.Column('moves', sa.String(), nullable=True))
+    op.create_index('ix_pokemon_author_code_id', 'pokemon', ['author_code', 'id'], unique=False)
+    op.drop_index(op.f('ix_pokemon_author_code'), table_name='pokemon')
+    for column in UNUSED_INDEXES:
+        op.drop_index(op.f(f'ix_pokemon_{column}'), table_name='pokemon')
+
+    # Online backfill: one short transaction per id range. The legacy move columns
+    # are kept, unused, so that a downgrade can restore them.
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        for start, end in id_ranges():
+            bind.execute(
+                sa.text(f'UPDATE pokemon SET moves = {PACK_MOVES} WHERE id > :start AND id <= :end AND moves IS NULL'),
+                {'start': start, 'end': end},
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    for start, end in id_ranges():
+        rows = bind.execute(
+            sa.text('SELECT id, moves FROM pokemon WHERE id > :start AND id <= :end AND moves IS NOT NULL'),
+            {'start': start, 'end': end},
+        ).all()
+        parameters = []
+        for row_id, moves in rows:
+            unpacked = (moves.split(',') if moves else []) + [None] * 4
+            parameters.append({'id': row_id, 'move1': unpacked[0], 'move2': unpacked[1], 'move3': unpacked[2], 'move4': unpacked[3]})
+        if parameters:
+            bind.execute(sa.text('UPDATE pokemon SET move1 = :move1, move2 = :move2, move3 = :move3, move4 = :move4 WHERE id = :id'), parameters)
+
+    for column in reversed(UNUSED_INDEXES):
+        op.create_index(op.f(f'ix_pokemon_{column}'), 'pokemon', [column], unique=False)
+    op.create_index(op.f('ix_pokemon_author_code'), 'pokemon', ['author_code'], unique=False)
+    op.drop_index('ix_pokemon_author_code_id', table_name='pokemon')
+    with op.batch_alter_table('pokemon') as batch_op:
+        batch_op.drop_column('moves')
@@ -0,0 +1 @@
+"""Benchmarks of the bot hot paths. Run them with `python -m benchmarks.<name>`."""
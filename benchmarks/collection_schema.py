@@ -0,0 +1,103 @@
+"""
+Benchmark of inserts and page reads with the legacy and the packed collection schemas.
+
+The legacy schema has four move columns and an index on every column. The packed
+schema stores the moves in a single column and only indexes (author_code, id).
+Rolls are inserted in write-behind batches, then -dex pages are read.
+
+Usage: python -m benchmarks.collection_schema [--rows 50000] [--batch-size 50] [--reads 5000]
+"""
+
+import argparse
+import logging
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.engine import Engine
+
+from frikibot.db.models import pokemon  # noqa: F401
+from frikibot.infrastructure import database
+
+logger = logging.getLogger("benchmarks.collection_schema")
+
+TRAINERS = 200
+MOVES = ("tackle", "ember", "growl", "scratch", "water-gun", "thunder-shock", "vine-whip", "quick-attack")
+
+LEGACY_COLUMNS = ("name", "first_type", "second_type", "author_code", "move1", "move2", "move3", "move4", "nature_name")
+LEGACY_SCHEMA = [
+    "CREATE TABLE pokemon (id INTEGER NOT NULL PRIMARY KEY, " + ", ".join(f"{column} VARCHAR" for column in LEGACY_COLUMNS) + ")",
+    "CREATE INDEX ix_pokemon_id ON pokemon (id)",
+    *(f"CREATE INDEX ix_pokemon_{column} ON pokemon ({column})" for column in LEGACY_COLUMNS),
+]
+LEGACY_INSERT = f"INSERT INTO pokemon ({', '.join(LEGACY_COLUMNS)}) VALUES ({', '.join('?' for _ in LEGACY_COLUMNS)})"  # noqa: S608
+LEGACY_PAGE = "SELECT id, name, move1, move2, move3, move4 FROM pokemon WHERE author_code = ? AND id > ? ORDER BY id LIMIT 5"
+
+PACKED_INSERT = "INSERT INTO pokemon (name, first_type, second_type, author_code, moves, nature_name) VALUES (?, ?, ?, ?, ?, ?)"
+PACKED_PAGE = "SELECT id, name, moves FROM pokemon WHERE author_code = ? AND id > ? ORDER BY id LIMIT 5"
+
+
+def build_rolls(rows: int) -> list[tuple[str, str, str, str, list[str], str]]:
+    """Build random rolls as (name, first type, second type, trainer, moves, nature)."""
+    rng = random.Random(0)  # noqa: S311
+    return [(f"pokemon-{rng.randrange(1000)}", "fire", "flying", str(rng.randrange(TRAINERS)), rng.sample(MOVES, 4), "bold") for _ in range(rows)]
+
+
+def insert(engine: Engine, statement: str, rows: list[tuple[object, ...]], batch_size: int) -> float:
+    """Insert the rows in batches, one transaction per batch, and return the rows per second."""
+    start = time.perf_counter()
+    for offset in range(0, len(rows), batch_size):
+        with engine.begin() as connection:
+            connection.exec_driver_sql(statement, rows[offset : offset + batch_size])
+    return len(rows) / (time.perf_counter() - start)
+
+
+def read(engine: Engine, statement: str, reads: int) -> float:
+    """Read the first page of random trainers and return the pages per second."""
+    rng = random.Random(1)  # noqa: S311
+    start = time.perf_counter()
+    with engine.connect() as connection:
+        for _ in range(reads):
+            connection.exec_driver_sql(statement, (str(rng.randrange(TRAINERS)), 0)).all()
+    return reads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000, help="Rolls inserted")
+    parser.add_argument("--batch-size", type=int, default=50, help="Rolls per transaction")
+    parser.add_argument("--reads", type=int, default=5000, help="Pages read")
+    args = parser.parse_args()
+
+    rolls = build_rolls(args.rows)
+    with tempfile.TemporaryDirectory() as directory:
+        legacy_path = Path(directory) / "legacy.db"
+        legacy = database.create_sqlite_engine(str(legacy_path))
+        with legacy.begin() as connection:
+            for statement in LEGACY_SCHEMA:
+                connection.exec_driver_sql(statement)
+        legacy_rows: list[tuple[object, ...]] = [(*roll[:4], *roll[4], roll[5]) for roll in rolls]
+        legacy_inserts = insert(legacy, LEGACY_INSERT, legacy_rows, args.batch_size)
+        legacy_reads = read(legacy, LEGACY_PAGE, args.reads)
+
+        packed_path = Path(directory) / "packed.db"
+        packed = database.create_sqlite_engine(str(packed_path))
+        database.Base.metadata.create_all(packed)
+        packed_rows: list[tuple[object, ...]] = [(*roll[:4], ",".join(roll[4]), roll[5]) for roll in rolls]
+        packed_inserts = insert(packed, PACKED_INSERT, packed_rows, args.batch_size)
+        packed_reads = read(packed, PACKED_PAGE, args.reads)
+
+        for name, engine, path, inserts, reads in (
+            ("legacy", legacy, legacy_path, legacy_inserts, legacy_reads),
+            ("packed", packed, packed_path, packed_inserts, packed_reads),
+        ):
+            with engine.connect() as connection:
+                connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+            logger.info("%-7s %8.0f inserts/s %8.0f pages/s %8.1f MB", name, inserts, reads, path.stat().st_size / 1024 / 1024)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="%(message)s")
+    main()
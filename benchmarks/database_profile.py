@@ -0,0 +1,148 @@
+"""
+Benchmark of concurrent reads and writes with the bare and the production database profiles.
+
+The bare profile is a plain create_engine with SQLite defaults (rollback journal,
+synchronous=FULL) shared by readers and writers. The production profile is a single
+writer plus a pool of read-only connections with the pragmas of database.py.
+Writers insert one roll per transaction and readers load -dex pages, all at once.
+
+Usage: python -m benchmarks.database_profile [--seconds 5] [--writers 4] [--readers 8]
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from frikibot.db.models.pokemon import Pokemon
+from frikibot.infrastructure import database
+from frikibot.infrastructure.sqlalchemy_pokemon_repository import SQLAlchemyPokemonRepository
+
+logger = logging.getLogger("benchmarks.database_profile")
+
+TRAINERS = 200
+SEED_ROWS = 20000
+
+
+def build_pokemon(rng: random.Random) -> Pokemon:
+    """Build a roll of a random trainer."""
+    return Pokemon(
+        name=f"pokemon-{rng.randrange(1000)}",
+        first_type="fire",
+        author_code=str(rng.randrange(TRAINERS)),
+        moves="tackle,ember,growl,scratch",
+        nature_name="bold",
+    )
+
+
+def seed(engine: Engine) -> None:
+    """Create the schema and the rolls already stored."""
+    database.Base.metadata.create_all(engine)
+    rng = random.Random(0)  # noqa: S311
+    with Session(engine) as session:
+        session.add_all(build_pokemon(rng) for _ in range(SEED_ROWS))
+        session.commit()
+
+
+class Results:
+    """Latencies and errors of a run."""
+
+    def __init__(self) -> None:
+        """Initialize empty results."""
+        self.latencies: dict[str, list[float]] = {"write": [], "read": []}
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def record(self, operation: str, start: float) -> None:
+        """Record an operation that started at start."""
+        with self.lock:
+            self.latencies[operation].append(time.perf_counter() - start)
+
+    def fail(self) -> None:
+        """Record a failed operation."""
+        with self.lock:
+            self.errors += 1
+
+
+def run(write_engine: Engine, read_engine: Engine, seconds: float, writers: int, readers: int) -> Results:
+    """Run writers and readers at once and collect their latencies."""
+    results = Results()
+    deadline = time.monotonic() + seconds
+
+    def write(worker: int) -> None:
+        rng = random.Random(worker)  # noqa: S311
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                with Session(write_engine) as session:
+                    session.add(build_pokemon(rng))
+                    session.commit()
+            except sqlalchemy.exc.OperationalError:
+                results.fail()
+                continue
+            results.record("write", start)
+
+    def read(worker: int) -> None:
+        rng = random.Random(1000 + worker)  # noqa: S311
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                with Session(read_engine) as session:
+                    repository = SQLAlchemyPokemonRepository(session)
+                    trainer_code = str(rng.randrange(TRAINERS))
+                    repository.count_by_trainer(trainer_code)
+                    repository.get_page_after(trainer_code, None, 5)
+            except sqlalchemy.exc.OperationalError:
+                results.fail()
+                continue
+            results.record("read", start)
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(writers)]
+    threads += [threading.Thread(target=read, args=(index,)) for index in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def report(name: str, results: Results, seconds: float) -> None:
+    """Log throughput and latencies of a profile."""
+    for operation, latencies in results.latencies.items():
+        p95 = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else float("nan")
+        logger.info("%-10s %-5s %8.0f ops/s  p95 %7.2fms", name, operation, len(latencies) / seconds, p95)
+    logger.info("%-10s lock errors: %d", name, results.errors)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5, help="Duration of every profile")
+    parser.add_argument("--writers", type=int, default=4, help="Threads inserting rolls")
+    parser.add_argument("--readers", type=int, default=8, help="Threads loading pages")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        bare_path = Path(directory) / "bare.db"
+        bare = sqlalchemy.create_engine(f"sqlite:///{bare_path}")
+        seed(bare)
+        report("bare", run(bare, bare, args.seconds, args.writers, args.readers), args.seconds)
+
+        tuned_path = str(Path(directory) / "tuned.db")
+        writer = database.create_sqlite_engine(tuned_path)
+        reader = database.create_sqlite_engine(tuned_path, read_only=True, pool_size=args.readers)
+        seed(writer)
+        report("production", run(writer, reader, args.seconds, args.writers, args.readers), args.seconds)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="%(message)s")
+    main()
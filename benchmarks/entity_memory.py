@@ -0,0 +1,75 @@
+"""
+Benchmark of the memory used by cached varieties.
+
+Compares the nested dictionaries of the PokeAPI documents, which VarietyDetails used
+to keep, against the compact VarietyDetails value objects built by from_json.
+
+Usage: python -m benchmarks.entity_memory [--varieties 1000] [--moves 80]
+"""
+
+import argparse
+import json
+import logging
+import random
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from frikibot.entities.variety_details import VarietyDetails
+from frikibot.shared.pokeapi_projection import project_variety
+
+logger = logging.getLogger("benchmarks.entity_memory")
+
+MOVE_POOL = 900
+ABILITY_POOL = 300
+TYPES = ("normal", "fire", "water", "grass", "electric", "ice", "fighting", "poison", "ground", "flying", "psychic", "bug")
+
+
+def build_document(index: int, moves: int, rng: random.Random) -> bytes:
+    """Build the projected /pokemon document of a variety, as returned by PokeAPI after projection."""
+    return json.dumps(
+        project_variety(
+            {
+                "is_default": True,
+                "name": f"pokemon-{index}",
+                "species": {"url": f"https://pokeapi.co/api/v2/pokemon-species/{index}/"},
+                "abilities": [{"ability": {"name": f"ability-{rng.randrange(ABILITY_POOL)}"}} for _ in range(3)],
+                "moves": [{"move": {"name": f"move-{move}"}} for move in rng.sample(range(MOVE_POOL), moves)],
+                "stats": [{"base_stat": rng.randrange(1, 256), "stat": {"name": "hp"}} for _ in range(6)],
+                "types": [{"type": {"name": pokemon_type}} for pokemon_type in rng.sample(TYPES, 2)],
+                "sprites": {"other": {"official-artwork": {"front_default": f"artwork/{index}.png", "front_shiny": f"artwork/shiny/{index}.png"}}},
+            }
+        )
+    ).encode()
+
+
+def measure(build: Callable[[bytes], Any], documents: list[bytes]) -> int:
+    """Return the bytes retained per variety when every document is kept in memory."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    cached = [build(document) for document in documents]
+    retained = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+    tracemalloc.stop()
+    del cached
+    return retained // len(documents)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--varieties", type=int, default=1000, help="Varieties kept in memory")
+    parser.add_argument("--moves", type=int, default=80, help="Moves of every variety")
+    args = parser.parse_args()
+
+    rng = random.Random(0)  # noqa: S311
+    documents = [build_document(index, args.moves, rng) for index in range(args.varieties)]
+    for name, build in (
+        ("nested dicts", json.loads),
+        ("VarietyDetails", lambda document: VarietyDetails.from_json(json.loads(document))),
+    ):
+        logger.info("%-15s %7d bytes per cached variety", name, measure(build, documents))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="%(message)s")
+    main()
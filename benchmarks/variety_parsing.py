@@ -0,0 +1,116 @@
+"""
+Benchmark of the parsing of /pokemon documents.
+
+Compares decoding the whole document with json.loads against decode_variety, which
+projects it to the fields used by the bot. Reports parse time, peak allocated bytes
+during the parse and bytes retained by the resulting VarietyDetails.
+
+Usage: python -m benchmarks.variety_parsing [--moves 120] [--rounds 50]
+"""
+
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from frikibot.entities.variety_details import VarietyDetails
+from frikibot.shared.pokeapi_projection import decode_variety
+
+logger = logging.getLogger("benchmarks.variety_parsing")
+
+SPRITES_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon"
+VERSION_GROUPS = 25
+GENERATIONS = 8
+
+
+def build_document(moves: int) -> bytes:
+    """Build a /pokemon document shaped like the one of a species with many moves."""
+    version_group_details = [
+        {
+            "level_learned_at": index,
+            "move_learn_method": {"name": "level-up", "url": "https://pokeapi.co/api/v2/move-learn-method/1/"},
+            "order": None,
+            "version_group": {"name": f"version-group-{index}", "url": f"https://pokeapi.co/api/v2/version-group/{index}/"},
+        }
+        for index in range(VERSION_GROUPS)
+    ]
+    artwork = {f"front_{kind}": f"{SPRITES_URL}/{kind}/448.png" for kind in ("default", "shiny", "female", "shiny_female")}
+    return json.dumps(
+        {
+            "abilities": [
+                {"ability": {"name": f"ability-{index}", "url": f"https://pokeapi.co/api/v2/ability/{index}/"}, "is_hidden": False, "slot": index}
+                for index in range(3)
+            ],
+            "base_experience": 184,
+            "forms": [{"name": "lucario", "url": "https://pokeapi.co/api/v2/pokemon-form/448/"}],
+            "game_indices": [
+                {"game_index": 448, "version": {"name": f"version-{index}", "url": f"https://pokeapi.co/api/v2/version/{index}/"}} for index in range(20)
+            ],
+            "height": 12,
+            "held_items": [],
+            "id": 448,
+            "is_default": True,
+            "moves": [
+                {"move": {"name": f"move-{index}", "url": f"https://pokeapi.co/api/v2/move/{index}/"}, "version_group_details": version_group_details}
+                for index in range(moves)
+            ],
+            "name": "lucario",
+            "species": {"name": "lucario", "url": "https://pokeapi.co/api/v2/pokemon-species/448/"},
+            "sprites": {
+                **artwork,
+                "other": {"official-artwork": artwork, "home": artwork, "showdown": artwork, "dream_world": artwork},
+                "versions": {f"generation-{generation}": {f"game-{game}": artwork for game in range(3)} for generation in range(GENERATIONS)},
+            },
+            "stats": [
+                {"base_stat": 70, "effort": 0, "stat": {"name": name, "url": "https://pokeapi.co/api/v2/stat/1/"}}
+                for name in ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+            ],
+            "types": [
+                {"slot": 1, "type": {"name": "fighting", "url": "https://pokeapi.co/api/v2/type/2/"}},
+                {"slot": 2, "type": {"name": "steel", "url": "https://pokeapi.co/api/v2/type/9/"}},
+            ],
+            "weight": 540,
+        }
+    ).encode()
+
+
+def measure(parse: Callable[[bytes], Any], document: bytes, rounds: int) -> tuple[float, int, int]:
+    """Return mean parse time in ms, peak allocated bytes while parsing and bytes retained by the result."""
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        parse(document)
+    elapsed = (time.perf_counter() - started_at) * 1000 / rounds
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = parse(document)
+    _, peak = tracemalloc.get_traced_memory()
+    retained = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+    tracemalloc.stop()
+    del result
+    return elapsed, peak, retained
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--moves", type=int, default=120, help="Moves of the synthetic document")
+    parser.add_argument("--rounds", type=int, default=50, help="Parses timed per decoder")
+    args = parser.parse_args()
+
+    document = build_document(args.moves)
+    logger.info("Document size: %d bytes", len(document))
+    for name, parse in (
+        ("json.loads", lambda content: VarietyDetails.from_json(json.loads(content))),
+        ("decode_variety", lambda content: VarietyDetails.from_json(decode_variety(content))),
+    ):
+        elapsed, peak, retained = measure(parse, document, args.rounds)
+        logger.info("%-15s parse: %7.2f ms  peak allocated: %9d bytes  retained: %9d bytes", name, elapsed, peak, retained)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="%(message)s")
+    main()
@@ -1,24 +1,47 @@
 """Controller to route Discord commands."""
 
+import asyncio
+import contextlib
 import logging
-import random
 import typing
 
 from discord.ext import commands
 
-from frikibot.db.models.trainer import Trainer
-from frikibot.infrastructure.database import SessionLocal
+from frikibot import pokemon_generator
+from frikibot.entities.pokemon import Pokemon
+from frikibot.infrastructure import database
+from frikibot.infrastructure.async_sqlalchemy_trainer_repository import AsyncSQLAlchemyTrainerRepository
+from frikibot.infrastructure.generation_executor import GenerationExecutor
+from frikibot.infrastructure.known_trainer_codes import KnownTrainerCodes
 from frikibot.infrastructure.paginated_view import PaginatedView
-from frikibot.infrastructure.sqlalchemy_pokemon_repository import SQLAlchemyPokemonRepository
-from frikibot.infrastructure.sqlalchemy_trainer_repository import SQLAlchemyTrainerRepository
+from frikibot.infrastructure.pokemon_reservoir import PokemonReservoir
+from frikibot.infrastructure.write_behind_pokemon_repository import WriteBehindPokemonRepository
+from frikibot.shared.exceptions import GenerationQueueFullError, GenerationTimeoutError
 from frikibot.usecases.generate_embed_usecase import GenerateEmbedUseCase
 from frikibot.usecases.generate_message_usecase import GenerateMessageUseCase
 from frikibot.usecases.generate_pokemon_usecase import GeneratePokemonUseCase
 
 logger = logging.getLogger(__name__)
 
-pokemon_repository = SQLAlchemyPokemonRepository(SessionLocal())
-trainer_repository = SQLAlchemyTrainerRepository(SessionLocal())
+pokemon_reservoir = PokemonReservoir(pokemon_generator.generate_random_pokemon)
+generation_executor = GenerationExecutor()
+pokemon_repository = WriteBehindPokemonRepository(database.engine, read_engine=database.read_engine)
+known_trainer_codes = KnownTrainerCodes()
+
+
+async def register_roll(pokemon: Pokemon, trainer_name: str) -> None:
+    """
+    Register the trainer of a roll and queue the roll to be saved.
+
+    Args:
+    ----
+            pokemon (Pokemon): Rolled Pokémon, bound to its trainer
+            trainer_name (str): Name of the trainer
+
+    """
+    async with database.async_session_scope() as session:
+        await AsyncSQLAlchemyTrainerRepository(session, known_trainer_codes).upsert(pokemon.author_code, trainer_name)
+    pokemon_repository.add(pokemon.to_orm())
 
 
 # ???: Is necessary to have a class?
@@ -47,27 +70,13 @@ class DiscordController:
                     ctx (commands.Context): Command context
 
             """
-            color = "shiny" if random.randint(0, 101) <= 10 else "default"  # noqa: S311
-
-            pokemon = GeneratePokemonUseCase(ctx, color).execute()
+            pokemon = await GeneratePokemonUseCase(ctx, pokemon_reservoir).execute()
             logger.info("Pokemon generated")
-            embed = GenerateEmbedUseCase(pokemon).execute()
-            logger.info("Embed generated")
-            message = GenerateMessageUseCase(ctx, color).execute()
+            message = GenerateMessageUseCase(ctx, pokemon.color).execute()
             logger.info("Message created")
-
-            if not trainer_repository.get_by_code(str(ctx.author.id)):
-                # TODO: This method should not receive a Trainer object, it should receive the code and name and create the object inside the method.
-                trainer_repository.add(
-                    Trainer(
-                        trainer_name=ctx.author.name,
-                        trainer_code=str(ctx.author.id),
-                    )
-                )
-                logger.info("Trainer added")
-
-            pokemon_repository.add(pokemon.to_orm())
-            await ctx.send(message, embed=embed)
+            embed = await generation_executor.run(GenerateEmbedUseCase(pokemon).execute)
+            logger.info("Embed generated")
+            await asyncio.gather(ctx.send(message, embed=embed), register_roll(pokemon, ctx.author.name))
 
         @commands.cooldown(1, 5, commands.BucketType.user)
         @self.__bot.command(
@@ -83,9 +92,7 @@ class DiscordController:
                     ctx (commands.Context[typing.Any]): Message context
 
             """
-            view = PaginatedView()
-            view.data = pokemon_repository.get_all_by_trainer(str(ctx.author.id))
-            view.user = ctx.author.name
+            view = PaginatedView(pokemon_repository, str(ctx.author.id), ctx.author.name, generation_executor)
             await view.send(ctx)
 
         @self.__bot.event
@@ -106,6 +113,9 @@ class DiscordController:
                 await ctx.send(
                     f" {ctx.author.mention} This command is actually on cooldown, wait {round(error.retry_after, 2)} seconds.",
                 )
+            elif isinstance(error, commands.CommandInvokeError) and isinstance(error.original, (GenerationQueueFullError, GenerationTimeoutError)):
+                logger.warning("Command %s dropped: %s", ctx.command, error.original)
+                await ctx.send(f" {ctx.author.mention} I am quite busy right now, try again in a few seconds.")
 
     def start(self, token: str) -> None:
         """
@@ -116,4 +126,29 @@ class DiscordController:
                 token (str): Discord bot token
 
         """
-        self.__bot.run(token)
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(self.__run(token))
+
+    async def __run(self, token: str) -> None:
+        """
+        Run the bot along with its background services and stop them once the bot stops.
+
+        Args:
+        ----
+                token (str): Discord bot token
+
+        """
+        await pokemon_generator.reference_registry.start()
+        pokemon_reservoir.start()
+        pokemon_repository.start()
+        try:
+            async with self.__bot:
+                await self.__bot.start(token)
+        finally:
+            await pokemon_reservoir.stop()
+            await pokemon_generator.reference_registry.stop()
+            await generation_executor.shutdown()
+            await asyncio.to_thread(pokemon_repository.close)
+            await database.async_engine.dispose()
+            await database.async_read_engine.dispose()
+            await pokemon_generator.pokeapi_client.close()
@@ -0,0 +1,51 @@
+"""Module for OfflinePokeAPIController class."""
+
+import random
+
+from frikibot.domain.pokemon_data_source import PokemonDataSource
+from frikibot.entities.nature import Nature
+from frikibot.entities.variety import Variety
+from frikibot.entities.variety_details import VarietyDetails
+from frikibot.infrastructure.reference_store import ReferenceStore
+from frikibot.shared.exceptions import NatureFetchError, VarietyDetailsFetchError, VarietyFetchError
+from frikibot.shared.pokeapi_urls import get_resource_path
+
+
+class OfflinePokeAPIController(PokemonDataSource):
+    """Controller serving PokeAPI data from the local reference store, without network access."""
+
+    def __init__(self, store: ReferenceStore) -> None:
+        """Initialize the controller with the reference store built by `python -m frikibot.dataset build`."""
+        self.__store = store
+        self.__nature_ids: list[int] = []
+
+    async def fetch_pokemon_varieties(self, pokemon_index: int) -> list[Variety]:
+        """Get all varieties of a Pokémon given its index."""
+        species = self.__store.get(f"pokemon-species/{pokemon_index}")
+        if species is None:
+            raise VarietyFetchError(f"Pokémon {pokemon_index} is not in the reference store")
+        return [Variety.from_json(v) for v in species["varieties"]]
+
+    async def fetch_variety_details(self, variety: Variety) -> VarietyDetails:
+        """Get details of a variety."""
+        details = self.__store.get(get_resource_path(variety.url))
+        if details is None:
+            raise VarietyDetailsFetchError(f"Variety {variety.name} is not in the reference store")
+        return VarietyDetails.from_json(details)
+
+    async def fetch_random_nature(self) -> Nature:
+        """Get a random nature."""
+        if not self.__nature_ids:
+            self.__nature_ids = self.__store.get_ids("nature")
+            if not self.__nature_ids:
+                raise NatureFetchError("There are no natures in the reference store")
+        nature_index = random.choice(self.__nature_ids)  # noqa: S311
+        return Nature.from_json(self.__store.get(f"nature/{nature_index}"))
+
+    async def fetch_natures(self) -> list[Nature]:
+        """Get every nature."""
+        return [Nature.from_json(self.__store.get(f"nature/{nature_index}")) for nature_index in self.__store.get_ids("nature")]
+
+    async def fetch_species_count(self) -> int:
+        """Get the number of species."""
+        return len(self.__store.get_ids("pokemon-species"))
@@ -1,10 +1,19 @@
 """Module for PokeAPIController class."""
 
 
+from frikibot.domain.pokemon_data_source import PokemonDataSource
 from frikibot.entities.nature import Nature
 from frikibot.entities.variety import Variety
 from frikibot.entities.variety_details import VarietyDetails
-from frikibot.usecases import fetch_pokemon_varieties_usecase, fetch_random_nature_usecase, fetch_variety_details_usecase
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
+from frikibot.shared.single_flight import SingleFlight
+from frikibot.usecases import (
+    fetch_natures_usecase,
+    fetch_pokemon_varieties_usecase,
+    fetch_random_nature_usecase,
+    fetch_species_count_usecase,
+    fetch_variety_details_usecase,
+)
 
 
 class PokeAPIController:
@@ -21,3 +30,32 @@ class PokeAPIController:
     def fetch_random_nature(self) -> Nature:
         """Get a random nature."""
         return fetch_random_nature_usecase.FetchRandomNatureUseCase().execute()
+
+
+class AsyncPokeAPIController(PokemonDataSource):
+    """Controller for handling PokeAPI interactions without blocking the event loop."""
+
+    def __init__(self, client: PokeAPIClient) -> None:
+        """Initialize the controller with the client shared by every request."""
+        self.__client = client
+        self.single_flight = SingleFlight()
+
+    async def fetch_pokemon_varieties(self, pokemon_index: int) -> list[Variety]:
+        """Get all varieties of a Pokémon given its index."""
+        return await fetch_pokemon_varieties_usecase.AsyncFetchPokemonVarietiesUseCase(self.__client, self.single_flight).execute(pokemon_index)
+
+    async def fetch_variety_details(self, variety: Variety) -> VarietyDetails:
+        """Get details of a variety."""
+        return await fetch_variety_details_usecase.AsyncFetchVarietyDetailsUseCase(self.__client, self.single_flight).execute(variety)
+
+    async def fetch_random_nature(self) -> Nature:
+        """Get a random nature."""
+        return await fetch_random_nature_usecase.AsyncFetchRandomNatureUseCase(self.__client, self.single_flight).execute()
+
+    async def fetch_natures(self) -> list[Nature]:
+        """Get every nature."""
+        return await fetch_natures_usecase.AsyncFetchNaturesUseCase(self.__client, self.single_flight).execute()
+
+    async def fetch_species_count(self) -> int:
+        """Get the number of species."""
+        return await fetch_species_count_usecase.AsyncFetchSpeciesCountUseCase(self.__client, self.single_flight).execute()
@@ -0,0 +1,6 @@
+"""
+Offline PokeAPI dataset.
+
+This package builds the local reference store used when POKEAPI_SOURCE is "offline".
+Run `python -m frikibot.dataset build --help` for details.
+"""
@@ -0,0 +1,57 @@
+"""
+Command line interface of the offline PokeAPI dataset.
+
+Usage: python -m frikibot.dataset build --source <dump folder or cache file> [--output <file>] [--max-index <n>]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from frikibot.dataset.builder import build_reference_store
+from frikibot.dataset.sources import open_source
+from frikibot.infrastructure.reference_store import ReferenceStore
+from frikibot.shared.global_variables import MAX_INDEX, REFERENCE_DB_PATH
+
+logger = logging.getLogger("frikibot.dataset")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the command line interface.
+
+    Args:
+    ----
+        argv (list[str] | None): Arguments of the command. Defaults to sys.argv.
+
+    Returns:
+    -------
+        int: Exit code.
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m frikibot.dataset", description="Offline PokeAPI dataset tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Build the local reference store from recorded PokeAPI resources")
+    build.add_argument("--source", type=Path, required=True, help="Folder of a PokeAPI dump (api-data layout) or SQLite file of the PokeAPI cache")
+    build.add_argument("--output", type=Path, default=Path(REFERENCE_DB_PATH), help=f"Reference store to write (default: {REFERENCE_DB_PATH})")
+    build.add_argument("--max-index", type=int, default=MAX_INDEX, help=f"Pokédex number of the last species (default: {MAX_INDEX})")
+    args = parser.parse_args(argv)
+
+    store = ReferenceStore(str(args.output))
+    try:
+        report = build_reference_store(open_source(args.source), store, args.max_index)
+    finally:
+        store.close()
+
+    logger.info("Reference store written to %s", args.output)
+    logger.info("Species: %d, varieties: %d, natures: %d", report.species, report.varieties, report.natures)
+    if report.missing:
+        logger.warning("%d resources missing in the source, first ones: %s", len(report.missing), ", ".join(report.missing[:10]))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO", format="%(name)s-%(levelname)s-%(message)s")
+    sys.exit(main())
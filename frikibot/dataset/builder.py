@@ -0,0 +1,69 @@
+"""Builder of the local reference store."""
+
+import logging
+from typing import Any
+
+from frikibot.dataset.sources import RecordedSource
+from frikibot.infrastructure.reference_store import ReferenceStore
+from frikibot.shared.global_variables import MAX_INDEX
+from frikibot.shared.pokeapi_projection import project_nature, project_species, project_variety
+from frikibot.shared.pokeapi_urls import get_resource_path
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100  # Species written to the store per transaction
+
+
+class BuildReport:
+    """Summary of a build of the reference store."""
+
+    def __init__(self) -> None:
+        """Initialize an empty report."""
+        self.species = 0
+        self.varieties = 0
+        self.natures = 0
+        self.missing: list[str] = []
+
+
+def build_reference_store(source: RecordedSource, store: ReferenceStore, max_index: int = MAX_INDEX) -> BuildReport:
+    """
+    Copy every species up to max_index, their varieties and every nature from a source into the store.
+
+    Args:
+    ----
+        source (RecordedSource): Recorded PokeAPI resources.
+        store (ReferenceStore): Store to fill.
+        max_index (int): Pokédex number of the last species to copy.
+
+    Returns:
+    -------
+        BuildReport: Counts of copied resources and paths missing in the source.
+
+    """
+    report = BuildReport()
+    batch: dict[str, Any] = {}
+    for pokemon_index in range(1, max_index + 1):
+        species = source.get(f"pokemon-species/{pokemon_index}")
+        if species is None:
+            report.missing.append(f"pokemon-species/{pokemon_index}")
+            continue
+        batch[f"pokemon-species/{pokemon_index}"] = project_species(species)
+        report.species += 1
+        for variety in species["varieties"]:
+            path = get_resource_path(variety["pokemon"]["url"])
+            details = source.get(path)
+            if details is None:
+                report.missing.append(path)
+                continue
+            batch[path] = project_variety(details)
+            report.varieties += 1
+        if pokemon_index % BATCH_SIZE == 0:
+            store.put_many(batch)
+            batch = {}
+            logger.info("Species copied: %d/%d", pokemon_index, max_index)
+
+    for nature_index in source.get_ids("nature"):
+        batch[f"nature/{nature_index}"] = project_nature(source.get(f"nature/{nature_index}"))
+        report.natures += 1
+    store.put_many(batch)
+    return report
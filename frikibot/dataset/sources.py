@@ -0,0 +1,112 @@
+"""Sources of recorded PokeAPI resources."""
+
+import abc
+import json
+from pathlib import Path
+from typing import Any
+
+from frikibot.infrastructure.pokeapi_cache import PokeAPICache
+from frikibot.shared.pokeapi_urls import get_resource_path
+
+
+class RecordedSource(abc.ABC):
+    """Source of recorded PokeAPI resources."""
+
+    @abc.abstractmethod
+    def get(self, path: str) -> Any:
+        """
+        Get a recorded resource.
+
+        Args:
+        ----
+            path (str): Resource path, like 'nature/3'.
+
+        Returns:
+        -------
+            Any: Decoded resource, or None if it was not recorded.
+
+        """
+
+    @abc.abstractmethod
+    def get_ids(self, endpoint: str) -> list[int]:
+        """
+        Get the ids of every recorded resource of an endpoint.
+
+        Args:
+        ----
+            endpoint (str): Endpoint of the resources, like 'nature'.
+
+        Returns:
+        -------
+            list[int]: Sorted ids of the resources.
+
+        """
+
+
+class DumpSource(RecordedSource):
+    """
+    PokeAPI dump laid out like the PokeAPI/api-data repository.
+
+    Every resource lives in `<root>/api/v2/<endpoint>/<id>/index.json`.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the source with the root folder of the dump."""
+        for candidate in (root / "data" / "api" / "v2", root / "api" / "v2", root):
+            if candidate.is_dir():
+                self.__base = candidate
+                break
+        else:
+            raise FileNotFoundError(f"PokeAPI dump not found at {root}")
+
+    def get(self, path: str) -> Any:
+        """Get a recorded resource."""
+        file = self.__base / path / "index.json"
+        if not file.is_file():
+            return None
+        return json.loads(file.read_bytes())
+
+    def get_ids(self, endpoint: str) -> list[int]:
+        """Get the ids of every recorded resource of an endpoint."""
+        folder = self.__base / endpoint
+        if not folder.is_dir():
+            return []
+        return sorted(int(child.name) for child in folder.iterdir() if child.name.isdigit())
+
+
+class CacheSource(RecordedSource):
+    """Responses recorded by the PokeAPI cache of the bot."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the source with the SQLite file of the cache."""
+        self.__cache = PokeAPICache(str(path))
+        self.__urls = {get_resource_path(url): url for url in self.__cache.urls()}
+
+    def get(self, path: str) -> Any:
+        """Get a recorded resource."""
+        url = self.__urls.get(path)
+        cached = self.__cache.get(url) if url else None
+        return json.loads(cached.content) if cached else None
+
+    def get_ids(self, endpoint: str) -> list[int]:
+        """Get the ids of every recorded resource of an endpoint."""
+        ids = (path.split("/")[1] for path in self.__urls if path.count("/") == 1 and path.startswith(f"{endpoint}/"))
+        return sorted(int(resource_id) for resource_id in ids if resource_id.isdigit())
+
+
+def open_source(path: Path) -> RecordedSource:
+    """
+    Open a source of recorded resources, guessing its kind from the path.
+
+    Args:
+    ----
+        path (Path): Folder of a PokeAPI dump or SQLite file of the PokeAPI cache.
+
+    Returns:
+    -------
+        RecordedSource: The opened source.
+
+    """
+    if path.is_file():
+        return CacheSource(path)
+    return DumpSource(path)
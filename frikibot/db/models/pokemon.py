@@ -4,18 +4,29 @@ import sqlalchemy
 
 from frikibot.infrastructure import database
 
+MOVES_SEPARATOR = ","
+
 
 class Pokemon(database.Base):
-    """Pokemon ORM model."""
+    """
+    Pokemon ORM model.
+
+    Moves are packed in a single column, and the only secondary index is the
+    (author_code, id) one that collection pages seek on.
+    """
 
     __tablename__ = "pokemon"
-    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, index=True)
-    name = sqlalchemy.Column(sqlalchemy.String, index=True)
-    first_type = sqlalchemy.Column(sqlalchemy.String, index=True)
-    second_type = sqlalchemy.Column(sqlalchemy.String, index=True, nullable=True)
-    author_code = sqlalchemy.Column(sqlalchemy.String, index=True)
-    move1 = sqlalchemy.Column(sqlalchemy.String, index=True)
-    move2 = sqlalchemy.Column(sqlalchemy.String, index=True)
-    move3 = sqlalchemy.Column(sqlalchemy.String, index=True)
-    move4 = sqlalchemy.Column(sqlalchemy.String, index=True)
-    nature_name = sqlalchemy.Column(sqlalchemy.String, index=True)
+    __table_args__ = (sqlalchemy.Index("ix_pokemon_author_code_id", "author_code", "id"),)
+    id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    name = sqlalchemy.Column(sqlalchemy.String)
+    first_type = sqlalchemy.Column(sqlalchemy.String)
+    second_type = sqlalchemy.Column(sqlalchemy.String, nullable=True)
+    author_code = sqlalchemy.Column(sqlalchemy.String)
+    moves = sqlalchemy.Column(sqlalchemy.String, default="")
+    nature_name = sqlalchemy.Column(sqlalchemy.String)
+    shiny = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False, default=False, server_default=sqlalchemy.false())
+
+    @property
+    def moves_list(self) -> list[str]:
+        """Moves of the Pokémon, unpacked."""
+        return self.moves.split(MOVES_SEPARATOR) if self.moves else []
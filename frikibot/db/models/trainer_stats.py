@@ -0,0 +1,25 @@
+"""Trainer stats ORM models, maintained incrementally on every insert into pokemon."""
+
+import sqlalchemy
+
+from frikibot.infrastructure import database
+
+
+class TrainerStats(database.Base):
+    """Totals of the collection of a trainer."""
+
+    __tablename__ = "trainer_stats"
+    author_code = sqlalchemy.Column(sqlalchemy.String, primary_key=True)
+    total = sqlalchemy.Column(sqlalchemy.Integer, nullable=False, default=0)
+    shiny = sqlalchemy.Column(sqlalchemy.Integer, nullable=False, default=0)
+
+
+class TrainerStatsCount(database.Base):
+    """Pokémon of a trainer with a given type or nature."""
+
+    __tablename__ = "trainer_stats_count"
+    __table_args__ = {"sqlite_with_rowid": False}
+    author_code = sqlalchemy.Column(sqlalchemy.String, primary_key=True)
+    category = sqlalchemy.Column(sqlalchemy.String, primary_key=True)  # "type" or "nature"
+    value = sqlalchemy.Column(sqlalchemy.String, primary_key=True)
+    count = sqlalchemy.Column(sqlalchemy.Integer, nullable=False, default=0)
@@ -0,0 +1,47 @@
+"""Asynchronous trainer repository interface definition."""
+
+import abc
+
+from frikibot.db.models.trainer import Trainer
+
+
+class AsyncTrainerRepository(abc.ABC):
+    """Asynchronous trainer repository interface."""
+
+    @abc.abstractmethod
+    async def add(self, trainer: Trainer) -> None:
+        """
+        Add a trainer to the repository.
+
+        Args:
+        ----
+            trainer (Trainer): Trainer to add
+
+        """
+
+    @abc.abstractmethod
+    async def upsert(self, trainer_code: str, trainer_name: str) -> None:
+        """
+        Register a trainer unless a trainer with the same code already exists.
+
+        Args:
+        ----
+            trainer_code (str): Trainer code
+            trainer_name (str): Trainer name
+
+        """
+
+    @abc.abstractmethod
+    async def get_by_code(self, trainer_code: str) -> Trainer | None:
+        """
+        Get a trainer by their code.
+
+        Args:
+        ----
+            trainer_code (str): Trainer code
+
+        Returns:
+        -------
+            Trainer | None: Trainer if found, else None
+
+        """
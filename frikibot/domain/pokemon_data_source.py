@@ -0,0 +1,74 @@
+"""Abstract base class for the sources of Pokémon data."""
+
+import abc
+
+from frikibot.entities.nature import Nature
+from frikibot.entities.variety import Variety
+from frikibot.entities.variety_details import VarietyDetails
+
+
+class PokemonDataSource(abc.ABC):
+    """Abstract base class for the sources of Pokémon data."""
+
+    @abc.abstractmethod
+    async def fetch_pokemon_varieties(self, pokemon_index: int) -> list[Variety]:
+        """
+        Get all varieties of a Pokémon given its index.
+
+        Args:
+        ----
+            pokemon_index (int): Pokédex number of the Pokémon.
+
+        Returns:
+        -------
+            list[Variety]: Varieties of the Pokémon.
+
+        """
+
+    @abc.abstractmethod
+    async def fetch_variety_details(self, variety: Variety) -> VarietyDetails:
+        """
+        Get details of a variety.
+
+        Args:
+        ----
+            variety (Variety): The variety to get details for.
+
+        Returns:
+        -------
+            VarietyDetails: The details of the variety.
+
+        """
+
+    @abc.abstractmethod
+    async def fetch_random_nature(self) -> Nature:
+        """
+        Get a random nature.
+
+        Returns
+        -------
+            Nature: A random nature.
+
+        """
+
+    @abc.abstractmethod
+    async def fetch_natures(self) -> list[Nature]:
+        """
+        Get every nature.
+
+        Returns
+        -------
+            list[Nature]: Every nature.
+
+        """
+
+    @abc.abstractmethod
+    async def fetch_species_count(self) -> int:
+        """
+        Get the number of species, which is also the Pokédex number of the last one.
+
+        Returns
+        -------
+            int: Number of species.
+
+        """
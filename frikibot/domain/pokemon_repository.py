@@ -34,3 +34,52 @@ class PokemonRepository(abc.ABC):
 
         """
         ...
+
+    @abc.abstractmethod
+    def count_by_trainer(self, trainer_code: str) -> int:
+        """
+        Count the Pokemons of a specific trainer.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+
+        Returns:
+        -------
+            int: Number of Pokemons owned by the trainer.
+
+        """
+
+    @abc.abstractmethod
+    def get_page_after(self, trainer_code: str, after_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that follow a given one, oldest first.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            after_id (int | None): ID of the last Pokemon of the previous page, None for the first page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
+
+    @abc.abstractmethod
+    def get_page_before(self, trainer_code: str, before_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that precede a given one, oldest first.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            before_id (int | None): ID of the first Pokemon of the next page, None for the last page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
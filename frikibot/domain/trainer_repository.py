@@ -19,6 +19,18 @@ class TrainerRepository(abc.ABC):
 
         """
 
+    @abc.abstractmethod
+    def upsert(self, trainer_code: str, trainer_name: str) -> None:
+        """
+        Register a trainer unless a trainer with the same code already exists.
+
+        Args:
+        ----
+            trainer_code (str): Trainer code
+            trainer_name (str): Trainer name
+
+        """
+
     @abc.abstractmethod
     def get_by_code(self, trainer_code: str) -> Trainer | None:
         """
@@ -0,0 +1,35 @@
+"""Trainer stats repository interface definition."""
+
+import abc
+
+from frikibot.entities.trainer_stats import TrainerStats
+
+
+class TrainerStatsRepository(abc.ABC):
+    """Trainer stats repository interface."""
+
+    @abc.abstractmethod
+    def get_by_trainer(self, trainer_code: str) -> TrainerStats:
+        """
+        Get the stats of the collection of a trainer.
+
+        Args:
+        ----
+            trainer_code (str): Trainer code
+
+        Returns:
+        -------
+            TrainerStats: Stats of the trainer, empty if they have no Pokémon
+
+        """
+
+    @abc.abstractmethod
+    def rebuild(self) -> int:
+        """
+        Recompute the stats of every trainer from their Pokémon.
+
+        Returns
+        -------
+            int: Number of trainers with stats
+
+        """
@@ -1,31 +1,26 @@
 """Nature representation."""
 
+import dataclasses
+import sys
 from typing import Any
 
 
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class Nature:
-    """Nature representation."""
+    """
+    Nature representation.
 
-    def __init__(self, *, name: str, decreased: str | None, increased: str | None):
-        """Create a Nature."""
-        self.__name = name
-        self.__decreased = decreased
-        self.__increased = increased
+    Attributes
+    ----------
+            name (str): The name of the nature.
+            decreased (str | None): The decreased stat.
+            increased (str | None): The increased stat.
 
-    @property
-    def decreased(self) -> str | None:
-        """The decreased stat."""
-        return self.__decreased
+    """
 
-    @property
-    def increased(self) -> str | None:
-        """The increased stat."""
-        return self.__increased
-
-    @property
-    def name(self) -> str:
-        """The name of the nature."""
-        return self.__name
+    name: str
+    decreased: str | None
+    increased: str | None
 
     @staticmethod
     def from_json(data: dict[str, Any]) -> "Nature":
@@ -35,9 +30,9 @@ class Nature:
         increased_stat = data.get("increased_stat")
 
         return Nature(
-            name=name,
-            decreased=decreased_stat["name"] if decreased_stat else None,
-            increased=increased_stat["name"] if increased_stat else None,
+            name=sys.intern(name),
+            decreased=sys.intern(decreased_stat["name"]) if decreased_stat else None,
+            increased=sys.intern(increased_stat["name"]) if increased_stat else None,
         )
 
     def __repr__(self) -> str:
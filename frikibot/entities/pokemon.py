@@ -5,8 +5,7 @@ This module contains a class for Pokémon entities
 """
 
 from logging import getLogger
-from secrets import randbelow
-from typing import Any
+from secrets import SystemRandom, randbelow
 
 from frikibot.db.models import pokemon as pokemon_model
 from frikibot.entities.nature import Nature
@@ -14,10 +13,27 @@ from frikibot.entities.stats import Stats
 
 logger = getLogger("Pokemon")
 
+MOVES_PER_POKEMON = 4
+
 
 class Pokemon:
     """Pokémon definition."""
 
+    __slots__ = (
+        "ability",
+        "author_code",
+        "color",
+        "first_type",
+        "moves_list",
+        "name",
+        "nature",
+        "nature_name",
+        "pokedex_number",
+        "second_type",
+        "sprite",
+        "stats",
+    )
+
     def __init__(
         self,
         *,
@@ -27,10 +43,11 @@ class Pokemon:
         first_type: str,
         second_type: str | None,
         author_code: str,
-        available_abilities: list[dict[str, Any]],
-        available_moves: list[dict[str, Any]],
+        available_abilities: tuple[str, ...],
+        available_moves: tuple[str, ...],
         stats: Stats,
         sprite: str | None,
+        color: str = "default",
     ):
         """
         Create Pokémon instance.
@@ -43,78 +60,58 @@ class Pokemon:
             first_type (str): Primary type
             second_type (str | None): Secondary type if there is
             author_code (str): Trainer id
-            available_abilities (list[dict]): List of Pokémon available abilities
-            available_moves (list[dict]): List of available moves
+            available_abilities (tuple[str, ...]): Names of the Pokémon available abilities
+            available_moves (tuple[str, ...]): Names of the available moves
             stats (Stats): Pokémon stats
             sprite (str | None): Url of the sprite
+            color (str): Pokémon color, ["default", "shiny"]
 
         """
         logger.debug("Pokemon initalization started.")
         self.name = name
-        logger.debug("Pokemon name set")
         self.pokedex_number = list_index
-        logger.debug("Pokemon pokedex_number set")
         self.nature = nature
-        logger.debug("Pokemon nature set")
-        try:
-            self.nature_name = nature.name
-            logger.debug("Pokemon nature_name set")
-        except KeyError:
-            self.nature_name = "Unknown nature"
-            logger.warning(
-                "Nature name could not be obtained from given nature: %s",
-                nature,
-            )
+        self.nature_name = nature.name
         self.first_type = first_type
-        logger.debug("Pokemon first_type set")
         self.second_type = second_type
-        logger.debug("Pokemon second_type set")
         self.author_code = author_code
-        logger.debug("Pokemon author_code set")
         self.moves_list = self._get_pokemon_moves(available_moves)
-        logger.debug("Pokemon moves_list set")
         self.ability = self._get_random_ability(available_abilities)
-        logger.debug("Pokemon ability set")
         self.sprite = sprite
-
+        self.color = color
         self.stats = stats
+        logger.debug("Pokemon initalization finished.")
 
-    def _get_pokemon_moves(self, available_moves: list[dict[str, Any]]) -> list[str]:
+    def _get_pokemon_moves(self, available_moves: tuple[str, ...]) -> list[str]:
         """
-        Generate four random moves from the possible ones of the Pokémon to learn.
+        Pick four different random moves from the possible ones of the Pokémon to learn.
 
         Args:
         ----
-            available_moves (list[dict): List of all moves which this Pokémon can learn.
+            available_moves (tuple[str, ...]): Names of all moves which this Pokémon can learn.
 
         Returns:
         -------
-            List[str]: List of Pokémon moves
+            List[str]: List of Pokémon moves, less than four if the Pokémon cannot learn that many
 
         """
-        ret: list[str] = []
-        while len(ret) < 4:
-            move = available_moves[randbelow(len(available_moves))]["move"]["name"]
-
-            if move not in ret:
-                ret.append(move)
-        return ret
+        unique_moves = list(dict.fromkeys(available_moves))
+        return SystemRandom().sample(unique_moves, min(MOVES_PER_POKEMON, len(unique_moves)))
 
-    def _get_random_ability(self, abilities_list: list[dict[str, Any]]) -> str:
+    def _get_random_ability(self, abilities_list: tuple[str, ...]) -> str:
         """
         Pick a random ability from the availables.
 
         Args:
         ----
-            abilities_list (list[dict]): List of available abilities
+            abilities_list (tuple[str, ...]): Names of the available abilities
 
         Returns:
         -------
-            dict: Chosen ability
+            str: Chosen ability
 
         """
-        ability: str = abilities_list[randbelow(len(abilities_list))]["ability"]["name"]
-        return ability
+        return abilities_list[randbelow(len(abilities_list))]
 
     def to_orm(self) -> pokemon_model.Pokemon:
         """
@@ -130,9 +127,7 @@ class Pokemon:
             first_type=self.first_type,
             second_type=self.second_type,
             author_code=self.author_code,
-            move1=self.moves_list[0],
-            move2=self.moves_list[1],
-            move3=self.moves_list[2],
-            move4=self.moves_list[3],
+            moves=pokemon_model.MOVES_SEPARATOR.join(self.moves_list),
             nature_name=self.nature_name,
+            shiny=self.color == "shiny",
         )
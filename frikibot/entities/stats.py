@@ -4,55 +4,77 @@ Script made by David Gómez.
 This module contains the definition for class Stats.
 """
 
+import dataclasses
 import math
 from logging import getLogger
 from typing import Any
 
 logger = getLogger("Stats")
 
+STAT_NAMES = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
 
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Stats:
-    """Pokémon stats definition."""
-
-    hp: int | None = None
-    attack: int | None = None
-    defense: int | None = None
-    special_attack: int | None = None
-    special_defense: int | None = None
-    speed: int | None = None
-
-    def __init__(
-        self,
-        data: list[dict[str, Any]] | None,
-        decreased: str | None = None,
-        increased: str | None = None,
-    ):
+    """
+    Pokémon stats definition.
+
+    Attributes
+    ----------
+            base (tuple[int, ...]): Six base stats, in the order of STAT_NAMES.
+            decreased (str | None, optional): Stat decreased by nature. Defaults to None.
+            increased (str | None, optional): Stat increased by nature. Defaults to None.
+
+    """
+
+    base: tuple[int, ...] = (0, 0, 0, 0, 0, 0)
+    decreased: str | None = None
+    increased: str | None = None
+
+    @classmethod
+    def from_json(cls, data: list[dict[str, Any]], decreased: str | None = None, increased: str | None = None) -> "Stats":
         """
-        Pokémon stats constructor.
+        Create Pokémon stats from the stats list of PokeAPI.
 
         Args:
         ----
-            data (list[dict]): List of Pokémon stats
-            hp (int): Base hp stat
-            attack (int): Base attack stat
-            defense (int): Base defense stat
-            special_attack (int): Base special attack stat
-            special_defense (int): Base special defense stat
-            speed (int): Base speed stat
+            data (list[dict]): List of Pokémon stats, in the order of STAT_NAMES
             decreased (str | None, optional): Stat decreased by nature. Defaults to None.
             increased (str | None, optional): Stat increased by nature. Defaults to None.
 
         """
-        if data:
-            logger.debug("Stats_data: %s", data)
-            self.hp = data[0]["base_stat"]
-            self.attack = data[1]["base_stat"]
-            self.defense = data[2]["base_stat"]
-            self.special_attack = data[3]["base_stat"]
-            self.special_defense = data[4]["base_stat"]
-            self.speed = data[5]["base_stat"]
-        self.decreased = decreased
-        self.increased = increased
+        logger.debug("Stats_data: %s", data)
+        return cls(tuple(data[index]["base_stat"] if index < len(data) else 0 for index in range(len(STAT_NAMES))), decreased, increased)
+
+    @property
+    def hp(self) -> int:
+        """Base hp stat."""
+        return self.base[0]
+
+    @property
+    def attack(self) -> int:
+        """Base attack stat."""
+        return self.base[1]
+
+    @property
+    def defense(self) -> int:
+        """Base defense stat."""
+        return self.base[2]
+
+    @property
+    def special_attack(self) -> int:
+        """Base special attack stat."""
+        return self.base[3]
+
+    @property
+    def special_defense(self) -> int:
+        """Base special defense stat."""
+        return self.base[4]
+
+    @property
+    def speed(self) -> int:
+        """Base speed stat."""
+        return self.base[5]
 
     def __str__(self) -> str:
         """
@@ -101,11 +123,4 @@ class Stats:
             list: List of tuples [stat_name: stat_value]
 
         """
-        return [
-            ("hp", self.hp),
-            ("attack", self.attack),
-            ("defense", self.defense),
-            ("special-attack", self.special_attack),
-            ("special-defense", self.special_defense),
-            ("speed", self.speed),
-        ]
+        return list(zip(STAT_NAMES, self.base, strict=True))
@@ -0,0 +1,23 @@
+"""Trainer collection stats representation."""
+
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TrainerStats:
+    """
+    Stats of the collection of a trainer.
+
+    Attributes
+    ----------
+            total (int): Number of Pokémon.
+            shiny (int): Number of shiny Pokémon.
+            types (dict[str, int]): Number of Pokémon of every type, dual types counted in both.
+            natures (dict[str, int]): Number of Pokémon of every nature.
+
+    """
+
+    total: int = 0
+    shiny: int = 0
+    types: dict[str, int] = dataclasses.field(default_factory=dict)
+    natures: dict[str, int] = dataclasses.field(default_factory=dict)
@@ -0,0 +1,120 @@
+"""Asynchronous SQLAlchemy implementation of the Pokemon repository."""
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from frikibot.db.models import pokemon
+from frikibot.domain import async_pokemon_repository
+from frikibot.infrastructure.sqlalchemy_trainer_stats_repository import pokemon_row, trainer_stats_increments
+
+
+class AsyncSQLAlchemyPokemonRepository(async_pokemon_repository.AsyncPokemonRepository):
+    """Concrete implementation of AsyncPokemonRepository using a SQLAlchemy AsyncSession."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize the repository with a SQLAlchemy asynchronous session."""
+        self.session = session
+
+    async def add(self, pokemon: pokemon.Pokemon) -> None:
+        """
+        Add a Pokemon to the repository, updating the stats of its trainer in the same transaction.
+
+        Args:
+        ----
+            pokemon (pokemon.Pokemon): The Pokemon to add.
+
+        """
+        try:
+            self.session.add(pokemon)
+            for statement in trainer_stats_increments([pokemon_row(pokemon)]):
+                await self.session.execute(statement)
+            await self.session.commit()
+        except sqlalchemy.exc.SQLAlchemyError:
+            await self.session.rollback()
+
+    async def get_all_by_trainer(self, trainer_code: str) -> list[pokemon.Pokemon]:
+        """
+        Get all Pokemons for a specific trainer.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: A list of Pokemons owned by the trainer.
+
+        """
+        return await self.__all(sqlalchemy.select(pokemon.Pokemon).filter(pokemon.Pokemon.author_code == trainer_code))
+
+    async def count_by_trainer(self, trainer_code: str) -> int:
+        """
+        Count the Pokemons of a specific trainer.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+
+        Returns:
+        -------
+            int: Number of Pokemons owned by the trainer.
+
+        """
+        statement = sqlalchemy.select(sqlalchemy.func.count(pokemon.Pokemon.id)).filter(pokemon.Pokemon.author_code == trainer_code)
+        try:
+            return (await self.session.execute(statement)).scalar() or 0
+        except sqlalchemy.exc.SQLAlchemyError:
+            await self.session.rollback()
+            return 0
+
+    async def get_page_after(self, trainer_code: str, after_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that follow a given one, oldest first.
+
+        Seeks on (author_code, id) instead of using an offset, so every page costs the same.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            after_id (int | None): ID of the last Pokemon of the previous page, None for the first page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
+        statement = sqlalchemy.select(pokemon.Pokemon).filter(pokemon.Pokemon.author_code == trainer_code)
+        if after_id is not None:
+            statement = statement.filter(pokemon.Pokemon.id > after_id)
+        return await self.__all(statement.order_by(pokemon.Pokemon.id).limit(limit))
+
+    async def get_page_before(self, trainer_code: str, before_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that precede a given one, oldest first.
+
+        Seeks on (author_code, id) backwards instead of using an offset, so every page costs the same.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            before_id (int | None): ID of the first Pokemon of the next page, None for the last page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
+        statement = sqlalchemy.select(pokemon.Pokemon).filter(pokemon.Pokemon.author_code == trainer_code)
+        if before_id is not None:
+            statement = statement.filter(pokemon.Pokemon.id < before_id)
+        return (await self.__all(statement.order_by(pokemon.Pokemon.id.desc()).limit(limit)))[::-1]
+
+    async def __all(self, statement: sqlalchemy.Select[tuple[pokemon.Pokemon]]) -> list[pokemon.Pokemon]:
+        """Run a query of Pokemons, returning no Pokemons if it fails."""
+        try:
+            return list((await self.session.execute(statement)).scalars().all())
+        except sqlalchemy.exc.SQLAlchemyError:
+            await self.session.rollback()
+            return []
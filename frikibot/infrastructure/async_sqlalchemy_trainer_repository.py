@@ -0,0 +1,71 @@
+"""Asynchronous SQLAlchemy implementation of TrainerRepository."""
+
+import sqlalchemy
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from frikibot.db.models.trainer import Trainer
+from frikibot.domain.async_trainer_repository import AsyncTrainerRepository
+from frikibot.infrastructure.known_trainer_codes import KnownTrainerCodes
+
+
+class AsyncSQLAlchemyTrainerRepository(AsyncTrainerRepository):
+    """Concrete implementation of AsyncTrainerRepository using a SQLAlchemy AsyncSession."""
+
+    def __init__(self, session: AsyncSession, known_codes: KnownTrainerCodes | None = None) -> None:
+        """Initialize the repository with a SQLAlchemy asynchronous session and, optionally, codes known to be registered."""
+        self.session = session
+        self.known_codes = known_codes if known_codes is not None else KnownTrainerCodes()
+
+    async def add(self, trainer: Trainer) -> None:
+        """
+        Add a Trainer to the repository.
+
+        Args:
+        ----
+            trainer (Trainer): The Trainer to add.
+
+        """
+        try:
+            self.session.add(trainer)
+            await self.session.commit()
+        except sqlalchemy.exc.SQLAlchemyError:
+            await self.session.rollback()
+
+    async def upsert(self, trainer_code: str, trainer_name: str) -> None:
+        """
+        Register a trainer unless a trainer with the same code already exists.
+
+        Known codes are skipped without querying the database.
+
+        Args:
+        ----
+            trainer_code (str): The Trainer's unique code.
+            trainer_name (str): The Trainer's name.
+
+        """
+        if trainer_code in self.known_codes:
+            return
+        statement = insert(Trainer).values(trainer_code=trainer_code, trainer_name=trainer_name, enabled=True)
+        try:
+            await self.session.execute(statement.on_conflict_do_nothing(index_elements=["trainer_code"]))
+            await self.session.commit()
+        except sqlalchemy.exc.SQLAlchemyError:
+            await self.session.rollback()
+            return
+        self.known_codes.add(trainer_code)
+
+    async def get_by_code(self, trainer_code: str) -> Trainer | None:
+        """
+        Get a Trainer by their code.
+
+        Args:
+        ----
+            trainer_code (str): The Trainer's unique code.
+
+        Returns:
+        -------
+            Trainer | None: The Trainer if found, else None.
+
+        """
+        return (await self.session.execute(sqlalchemy.select(Trainer).filter_by(trainer_code=trainer_code).limit(1))).scalar_one_or_none()
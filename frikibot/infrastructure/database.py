@@ -1,25 +1,98 @@
 """SQLAlchemy database configuration module."""
 
+import contextlib
 import logging
-from typing import TYPE_CHECKING
+import sqlite3
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from frikibot.shared.global_variables import DATABASE_PATH, DATABASE_READ_POOL_SIZE, SQLITE_CACHE_SIZE_KB, SQLITE_MMAP_SIZE
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import AsyncIterator, Generator, Iterator
 
     from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
-# Create the SQLAlchemy engine
-engine = create_engine("sqlite:///db/pokemon.db")
+# Pragmas of every connection: WAL lets readers run alongside the writer, and
+# synchronous=NORMAL only syncs on checkpoints, which is still safe with WAL.
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -SQLITE_CACHE_SIZE_KB,
+    "mmap_size": SQLITE_MMAP_SIZE,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+
+def _apply_pragmas(dbapi_connection: sqlite3.Connection | Any, _connection_record: Any, *, read_only: bool) -> None:
+    """Apply the SQLite pragmas to a new connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma} = {value}")
+    if read_only:
+        cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+def create_sqlite_engine(path: str, *, read_only: bool = False, pool_size: int = 1) -> Engine:
+    """
+    Create an engine of a SQLite database with the production pragmas.
+
+    Args:
+    ----
+        path (str): Path of the database file.
+        read_only (bool): Whether the connections reject writes.
+        pool_size (int): Number of connections. A single connection serializes the writes of the process.
+
+    Returns:
+    -------
+        Engine: Engine of the database.
+
+    """
+    engine = create_engine(f"sqlite:///{path}", pool_size=pool_size, max_overflow=0, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", lambda dbapi_connection, record: _apply_pragmas(dbapi_connection, record, read_only=read_only))
+    return engine
+
+
+def create_async_sqlite_engine(path: str, *, read_only: bool = False, pool_size: int = 1) -> AsyncEngine:
+    """
+    Create an asynchronous engine of a SQLite database with the production pragmas, using aiosqlite.
+
+    Args:
+    ----
+        path (str): Path of the database file.
+        read_only (bool): Whether the connections reject writes.
+        pool_size (int): Number of connections. A single connection serializes the writes of the engine.
 
-# Create the session factory
+    Returns:
+    -------
+        AsyncEngine: Asynchronous engine of the database.
+
+    """
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=pool_size, max_overflow=0)
+    event.listen(async_engine.sync_engine, "connect", lambda dbapi_connection, record: _apply_pragmas(dbapi_connection, record, read_only=read_only))
+    return async_engine
+
+
+# Single writer and a pool of readers
+engine = create_sqlite_engine(DATABASE_PATH)
+read_engine = create_sqlite_engine(DATABASE_PATH, read_only=True, pool_size=DATABASE_READ_POOL_SIZE)
+async_engine = create_async_sqlite_engine(DATABASE_PATH)
+async_read_engine = create_async_sqlite_engine(DATABASE_PATH, read_only=True, pool_size=DATABASE_READ_POOL_SIZE)
+
+# Create the session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-SESSION = SessionLocal()
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
 
 # Base class for ORM models
 Base = declarative_base()
@@ -67,3 +140,57 @@ def get_db() -> "Generator[Session, None, None]":
         yield db
     finally:
         db.close()
+
+
+@contextlib.contextmanager
+def session_scope(*, read_only: bool = False) -> "Iterator[Session]":
+    """
+    Provide a session for a single command or task.
+
+    The session commits when the block ends, rolls back if it raises and is always closed.
+
+    Args:
+    ----
+        read_only (bool): Whether to use the pool of read-only connections.
+
+    Yields:
+    ------
+    Session
+        A SQLAlchemy session
+
+    """
+    session = (ReadSessionLocal if read_only else SessionLocal)()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+@contextlib.asynccontextmanager
+async def async_session_scope(*, read_only: bool = False) -> "AsyncIterator[AsyncSession]":
+    """
+    Provide an asynchronous session for a single command or task.
+
+    The session commits when the block ends, rolls back if it raises and is always closed.
+
+    Args:
+    ----
+        read_only (bool): Whether to use the pool of read-only connections.
+
+    Yields:
+    ------
+    AsyncSession
+        A SQLAlchemy asynchronous session
+
+    """
+    async with (AsyncReadSessionLocal if read_only else AsyncSessionLocal)() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -0,0 +1,135 @@
+"""Bounded pool of threads for the blocking work of commands."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from frikibot.shared.exceptions import GenerationQueueFullError, GenerationTimeoutError
+from frikibot.shared.global_variables import GENERATION_DEADLINE, GENERATION_QUEUE_SIZE, GENERATION_WORKERS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorStats:
+    """Counters of a GenerationExecutor."""
+
+    __slots__ = ("completed", "max_queue_depth", "max_wait", "queue_depth", "rejected", "submitted", "timed_out", "total_wait")
+
+    def __init__(self) -> None:
+        """Initialize every counter to zero."""
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _Job:
+    """Task submitted to a GenerationExecutor."""
+
+    __slots__ = ("cancelled", "started", "submitted_at")
+
+    def __init__(self) -> None:
+        """Initialize a job submitted now."""
+        self.submitted_at = time.perf_counter()
+        self.started = False
+        self.cancelled = False
+
+
+class GenerationExecutor:
+    """
+    Bounded pool of threads for the blocking work of commands.
+
+    Command handlers await the result of their blocking work (database sessions,
+    embed building) instead of running it on the event loop. At most queue_size tasks
+    wait for a free thread and every task has a deadline, waiting time included.
+    """
+
+    def __init__(self, *, workers: int = GENERATION_WORKERS, queue_size: int = GENERATION_QUEUE_SIZE, deadline: float = GENERATION_DEADLINE) -> None:
+        """
+        Initialize the executor. Threads are started on demand.
+
+        Args:
+        ----
+            workers (int): Number of threads.
+            queue_size (int): Maximum number of tasks waiting for a thread.
+            deadline (float): Seconds a task may take, waiting included.
+
+        """
+        self.__pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="generation")
+        self.__queue_size = queue_size
+        self.__deadline = deadline
+        self.__lock = threading.Lock()
+        self.stats = ExecutorStats()
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking function in a thread of the pool.
+
+        Args:
+        ----
+            function (Callable[..., T]): Blocking function.
+            *args (Any): Arguments of the function.
+
+        Returns:
+        -------
+            T: Result of the function.
+
+        Raises:
+        ------
+            GenerationQueueFullError: If queue_size tasks are already waiting for a thread.
+            GenerationTimeoutError: If the task does not finish before the deadline.
+
+        """
+        job = _Job()
+        with self.__lock:
+            if self.stats.queue_depth >= self.__queue_size:
+                self.stats.rejected += 1
+                raise GenerationQueueFullError(f"{self.stats.queue_depth} tasks are already waiting for a thread")
+            self.stats.submitted += 1
+            self.stats.queue_depth += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+
+        future = asyncio.get_running_loop().run_in_executor(self.__pool, self.__call, job, function, args)
+        try:
+            result = await asyncio.wait_for(future, self.__deadline)
+        except TimeoutError as exc:
+            with self.__lock:
+                self.stats.timed_out += 1
+                if not job.started:
+                    job.cancelled = True
+                    self.stats.queue_depth -= 1
+            raise GenerationTimeoutError(f"{getattr(function, '__qualname__', function)} did not finish in {self.__deadline} seconds") from exc
+        self.stats.completed += 1
+        return result
+
+    def __call(self, job: _Job, function: Callable[..., T], args: tuple[Any, ...]) -> T:
+        """Run a job in a thread of the pool, unless it missed its deadline while waiting."""
+        wait = time.perf_counter() - job.submitted_at
+        with self.__lock:
+            if job.cancelled:
+                raise CancelledError
+            job.started = True
+            self.stats.queue_depth -= 1
+            self.stats.total_wait += wait
+            self.stats.max_wait = max(self.stats.max_wait, wait)
+        logger.debug("Task %s waited %.1fms for a thread", getattr(function, "__qualname__", function), wait * 1000)
+        return function(*args)
+
+    async def shutdown(self) -> None:
+        """Wait for the running tasks and stop the threads."""
+        await asyncio.to_thread(self.__pool.shutdown)
+        logger.info("Generation executor stopped. Stats: %s", self.stats.as_dict())
@@ -0,0 +1,70 @@
+"""Bounded in-process set of trainer codes known to be registered."""
+
+import threading
+from collections import OrderedDict
+
+from frikibot.shared.global_variables import TRAINER_CACHE_SIZE
+
+
+class KnownTrainerCodesStats:
+    """Counters of a KnownTrainerCodes."""
+
+    __slots__ = ("evictions", "hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize every counter to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class KnownTrainerCodes:
+    """Least recently used set of trainer codes known to be registered, shared by threads."""
+
+    def __init__(self, max_size: int = TRAINER_CACHE_SIZE) -> None:
+        """
+        Initialize an empty set.
+
+        Args:
+        ----
+            max_size (int): Maximum number of codes remembered.
+
+        """
+        self.__max_size = max_size
+        self.__codes: OrderedDict[str, None] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.stats = KnownTrainerCodesStats()
+
+    def __contains__(self, trainer_code: object) -> bool:
+        """Whether the code is known, refreshing it as recently used."""
+        with self.__lock:
+            if trainer_code in self.__codes:
+                self.__codes.move_to_end(trainer_code)  # type: ignore[arg-type]
+                self.stats.hits += 1
+                return True
+            self.stats.misses += 1
+            return False
+
+    def __len__(self) -> int:
+        """Return the number of codes remembered."""
+        return len(self.__codes)
+
+    def add(self, trainer_code: str) -> None:
+        """
+        Remember a code, forgetting the least recently used one if full.
+
+        Args:
+        ----
+            trainer_code (str): Code of a registered trainer.
+
+        """
+        with self.__lock:
+            self.__codes[trainer_code] = None
+            self.__codes.move_to_end(trainer_code)
+            if len(self.__codes) > self.__max_size:
+                self.__codes.popitem(last=False)
+                self.stats.evictions += 1
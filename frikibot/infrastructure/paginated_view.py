@@ -4,6 +4,7 @@ Script made by David Gómez.
 This module defines Paginated View for Discord Message.
 """
 
+import asyncio
 import math
 import typing
 
@@ -11,15 +12,42 @@ import discord
 from discord.ext import commands
 
 from frikibot.db.models.pokemon import Pokemon
+from frikibot.domain.pokemon_repository import PokemonRepository
+from frikibot.infrastructure.generation_executor import GenerationExecutor
 
 
 class PaginatedView(discord.ui.View):
-    """Definition of paginated view."""
+    """
+    Definition of paginated view.
+
+    Only the page shown and its neighbours are loaded, each with a keyset query, so
+    the memory of a view and the time to its first page do not depend on the size of
+    the collection.
+    """
 
-    data: list[Pokemon]
     current_page: int = 1
+    page_count: int = 1
     separator: int = 5
-    user: str = "User"
+
+    def __init__(self, repository: PokemonRepository, trainer_code: str, user: str, executor: GenerationExecutor) -> None:
+        """
+        Initialize the view of the collection of a trainer.
+
+        Args:
+        ----
+            repository (PokemonRepository): Repository of the collection.
+            trainer_code (str): Code of the trainer.
+            user (str): Name shown in the title.
+            executor (GenerationExecutor): Executor running the queries off the event loop.
+
+        """
+        super().__init__()
+        self.__repository = repository
+        self.__trainer_code = trainer_code
+        self.__executor = executor
+        self.__pages: dict[int, asyncio.Task[list[Pokemon]]] = {}
+        self.user = user
+        self.count = 0
 
     def create_embed(self, data: list[Pokemon]) -> discord.Embed:
         """
@@ -38,12 +66,17 @@ class PaginatedView(discord.ui.View):
         for elem in data:
             embed.add_field(
                 name=elem.name.replace("-", " ").capitalize(),
-                value="\n".join([x.replace("-", " ").capitalize() for x in [elem.move1, elem.move2, elem.move3, elem.move4]]),
+                value="\n".join([x.replace("-", " ").capitalize() for x in elem.moves_list]),
             )
             # TODO: This function should not use the Pokémon Model from the Database.
 
         return embed
 
+    @property
+    def loaded_pages(self) -> list[int]:
+        """Numbers of the pages loaded or loading."""
+        return sorted(self.__pages)
+
     async def send(self, ctx: commands.Context[typing.Any]) -> None:
         """
         Send message to text channel.
@@ -53,8 +86,54 @@ class PaginatedView(discord.ui.View):
             ctx (commands.Context[typing.Any]): Command context
 
         """
+        first_page = self.__load(1)
+        self.count = await self.__executor.run(self.__repository.count_by_trainer, self.__trainer_code)
+        self.page_count = max(1, math.ceil(self.count / self.separator))
         self.message = await ctx.send(view=self)
-        await self.update_message(self.data[: self.separator])
+        await first_page
+        await self.show_page(1)
+
+    async def show_page(self, page: int) -> None:
+        """
+        Show a page, keeping only its neighbours loaded.
+
+        Args:
+        ----
+            page (int): Number of the page, clamped to the existing ones.
+
+        """
+        self.current_page = min(max(page, 1), self.page_count)
+        data = await self.__load(self.current_page)
+        neighbours = {self.current_page - 1, self.current_page, self.current_page + 1}
+        for loaded in self.__pages.keys() - neighbours:
+            del self.__pages[loaded]
+        for neighbour in neighbours:
+            if 1 <= neighbour <= self.page_count:
+                self.__load(neighbour)
+        await self.update_message(data)
+
+    def __load(self, page: int) -> asyncio.Task[list[Pokemon]]:
+        """Start loading a page unless it is already loaded or loading."""
+        if page not in self.__pages:
+            task = asyncio.ensure_future(self.__fetch(page))
+            task.add_done_callback(_consume_exception)
+            self.__pages[page] = task
+        return self.__pages[page]
+
+    async def __fetch(self, page: int) -> list[Pokemon]:
+        """Fetch a page, seeking from the first page, the last page or a loaded neighbour."""
+        if page == 1:
+            return await self.__executor.run(self.__repository.get_page_after, self.__trainer_code, None, self.separator)
+        if page == self.page_count:
+            last_page_size = self.count - (self.page_count - 1) * self.separator
+            return await self.__executor.run(self.__repository.get_page_before, self.__trainer_code, None, last_page_size)
+        if page + 1 in self.__pages and page - 1 not in self.__pages:
+            next_page = await self.__pages[page + 1]
+            before_id = next_page[0].id if next_page else None
+            return await self.__executor.run(self.__repository.get_page_before, self.__trainer_code, before_id, self.separator)
+        previous_page = await self.__load(page - 1)
+        after_id = previous_page[-1].id if previous_page else None
+        return await self.__executor.run(self.__repository.get_page_after, self.__trainer_code, after_id, self.separator)
 
     async def update_message(self, data: list[Pokemon]) -> None:
         """
@@ -83,10 +162,7 @@ class PaginatedView(discord.ui.View):
 
         """
         await interaction.response.defer()
-        self.current_page = 1
-        last_element = self.current_page * self.separator
-        starter_item = last_element - self.separator
-        await self.update_message(self.data[starter_item:last_element])
+        await self.show_page(1)
 
     @discord.ui.button(label="<-", style=discord.ButtonStyle.primary)
     async def previous_button(
@@ -104,11 +180,7 @@ class PaginatedView(discord.ui.View):
 
         """
         await interaction.response.defer()
-        if self.current_page > 1:
-            self.current_page -= 1
-        last_element = self.current_page * self.separator
-        starter_item = last_element - self.separator
-        await self.update_message(self.data[starter_item:last_element])
+        await self.show_page(self.current_page - 1)
 
     @discord.ui.button(label="->", style=discord.ButtonStyle.primary)
     async def next_button(
@@ -126,14 +198,7 @@ class PaginatedView(discord.ui.View):
 
         """
         await interaction.response.defer()
-        self.current_page += 1
-        last_element = self.current_page * self.separator
-        if last_element > len(self.data):
-            self.current_page -= 1
-            last_element = self.current_page * self.separator
-
-        starter_item = last_element - self.separator
-        await self.update_message(self.data[starter_item:last_element])
+        await self.show_page(self.current_page + 1)
 
     @discord.ui.button(label="->>", style=discord.ButtonStyle.primary)
     async def last_page_button(
@@ -151,7 +216,10 @@ class PaginatedView(discord.ui.View):
 
         """
         await interaction.response.defer()
-        last_element = len(self.data)
-        self.current_page = math.ceil(last_element / self.separator)
-        starter_item = last_element - self.separator
-        await self.update_message(self.data[starter_item:last_element])
+        await self.show_page(self.page_count)
+
+
+def _consume_exception(task: asyncio.Task[list[Pokemon]]) -> None:
+    """Retrieve the exception of a page load, so pages dropped before being shown do not log it as unhandled."""
+    if not task.cancelled():
+        task.exception()
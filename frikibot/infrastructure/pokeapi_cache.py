@@ -0,0 +1,191 @@
+"""Persistent cache of PokeAPI responses."""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from frikibot.shared.global_variables import POKEAPI_CACHE_DEFAULT_TTL, POKEAPI_CACHE_PATH, POKEAPI_CACHE_TTL
+from frikibot.shared.pokeapi_urls import get_endpoint
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS response (
+    url TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class CachedResponse:
+    """Response stored in the cache."""
+
+    __slots__ = ("content", "etag", "expires_at", "last_modified")
+
+    def __init__(self, *, content: bytes, etag: str | None, last_modified: str | None, expires_at: float):
+        """
+        Initialize a CachedResponse instance.
+
+        Args:
+        ----
+                content (bytes): Uncompressed body of the response.
+                etag (str | None): ETag header sent by PokeAPI.
+                last_modified (str | None): Last-Modified header sent by PokeAPI.
+                expires_at (float): Timestamp after which the response must be revalidated.
+
+        """
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self) -> bool:
+        """Return if the response can be served without revalidation."""
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers needed to revalidate the response."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheStats:
+    """Counters of a PokeAPICache."""
+
+    __slots__ = ("bytes_downloaded", "bytes_served", "bytes_stored", "hits", "misses", "revalidations")
+
+    def __init__(self) -> None:
+        """Initialize every counter to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_served = 0
+        self.bytes_downloaded = 0
+        self.bytes_stored = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PokeAPICache:
+    """
+    Persistent cache of PokeAPI responses keyed by URL.
+
+    Responses are stored zlib-compressed in a SQLite file, so the cache survives restarts.
+    Each response is fresh for the TTL of its endpoint; after that it is revalidated with
+    its ETag/Last-Modified headers instead of being downloaded again.
+    """
+
+    def __init__(self, path: str = POKEAPI_CACHE_PATH, ttl: dict[str, int] | None = None, default_ttl: int = POKEAPI_CACHE_DEFAULT_TTL):
+        """
+        Initialize the cache. The SQLite file is opened on first use.
+
+        Args:
+        ----
+                path (str): Path of the SQLite file.
+                ttl (dict[str, int] | None): Seconds of freshness by endpoint. Defaults to POKEAPI_CACHE_TTL.
+                default_ttl (int): Seconds of freshness for endpoints missing in ttl.
+
+        """
+        self.__path = path
+        self.__ttl = POKEAPI_CACHE_TTL if ttl is None else ttl
+        self.__default_ttl = default_ttl
+        self.__connection: sqlite3.Connection | None = None
+        self.__lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __get_connection(self) -> sqlite3.Connection:
+        """Return the connection to the SQLite file, opening it if needed."""
+        if self.__connection is None:
+            if self.__path != ":memory:":
+                Path(self.__path).parent.mkdir(parents=True, exist_ok=True)
+            self.__connection = sqlite3.connect(self.__path, check_same_thread=False)
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__connection.execute(_SCHEMA)
+            logger.info("PokeAPI cache opened at %s", self.__path)
+        return self.__connection
+
+    def ttl_for(self, url: str) -> int:
+        """Return the seconds of freshness for a URL."""
+        return self.__ttl.get(get_endpoint(url), self.__default_ttl)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """
+        Get a cached response.
+
+        Args:
+        ----
+                url (str): Requested URL.
+
+        Returns:
+        -------
+                CachedResponse | None: Cached response, fresh or not, or None if the URL is not cached.
+
+        """
+        with self.__lock:
+            row = self.__get_connection().execute("SELECT payload, etag, last_modified, expires_at FROM response WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        payload, etag, last_modified, expires_at = row
+        return CachedResponse(content=zlib.decompress(payload), etag=etag, last_modified=last_modified, expires_at=expires_at)
+
+    def put(self, url: str, content: bytes, *, etag: str | None = None, last_modified: str | None = None) -> None:
+        """
+        Store a response.
+
+        Args:
+        ----
+                url (str): Requested URL.
+                content (bytes): Uncompressed body of the response.
+                etag (str | None): ETag header of the response.
+                last_modified (str | None): Last-Modified header of the response.
+
+        """
+        payload = zlib.compress(content)
+        with self.__lock:
+            connection = self.__get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO response (url, payload, etag, last_modified, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (url, payload, etag, last_modified, time.time() + self.ttl_for(url)),
+            )
+            connection.commit()
+        self.stats.bytes_stored += len(payload)
+
+    def refresh(self, url: str) -> None:
+        """
+        Renew the freshness of a response confirmed unchanged by PokeAPI.
+
+        Args:
+        ----
+                url (str): Requested URL.
+
+        """
+        with self.__lock:
+            connection = self.__get_connection()
+            connection.execute("UPDATE response SET expires_at = ? WHERE url = ?", (time.time() + self.ttl_for(url), url))
+            connection.commit()
+
+    def urls(self) -> list[str]:
+        """Return every cached URL."""
+        with self.__lock:
+            return [url for (url,) in self.__get_connection().execute("SELECT url FROM response")]
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+        logger.info("PokeAPI cache closed. Stats: %s", self.stats.as_dict())
@@ -0,0 +1,131 @@
+"""Asynchronous HTTP client for PokeAPI."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+import aiohttp
+
+from frikibot.infrastructure.pokeapi_cache import PokeAPICache
+from frikibot.shared.global_variables import POKEAPI_MAX_CONNECTIONS, TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class PokeAPIResponse:
+    """Response of a PokeAPI request, already read from the connection."""
+
+    def __init__(self, status_code: int, content: bytes):
+        """
+        Initialize a PokeAPIResponse instance.
+
+        Args:
+        ----
+                status_code (int): HTTP status code of the response.
+                content (bytes): Raw body of the response.
+
+        """
+        self.status_code = status_code
+        self.content = content
+
+    def json(self) -> Any:
+        """Decode the body of the response as JSON."""
+        return json.loads(self.content)
+
+
+class PokeAPIClient:
+    """
+    Asynchronous PokeAPI client.
+
+    Every request goes through a single aiohttp session, so all of them share one
+    keep-alive connection pool instead of opening a new connection per request.
+    The session is created lazily inside the running event loop.
+
+    When a cache is given, fresh cached responses are served without touching the
+    network and stale ones are revalidated with a conditional request.
+    """
+
+    def __init__(self, *, cache: PokeAPICache | None = None, max_connections: int = POKEAPI_MAX_CONNECTIONS, timeout: float = TIMEOUT):
+        """
+        Initialize the client.
+
+        Args:
+        ----
+                cache (PokeAPICache | None): Persistent cache of responses. Defaults to no cache.
+                max_connections (int): Maximum number of simultaneous connections.
+                timeout (float): Total timeout of every request in seconds.
+
+        """
+        self.__cache = cache
+        self.__max_connections = max_connections
+        self.__timeout = aiohttp.ClientTimeout(total=timeout)
+        self.__session: aiohttp.ClientSession | None = None
+        self.__loop: asyncio.AbstractEventLoop | None = None
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it if there is none for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self.__session is None or self.__session.closed or self.__loop is not loop:
+            logger.debug("Creating PokeAPI session with %d connections", self.__max_connections)
+            connector = aiohttp.TCPConnector(limit=self.__max_connections, ttl_dns_cache=300)
+            self.__session = aiohttp.ClientSession(connector=connector, timeout=self.__timeout)
+            self.__loop = loop
+        return self.__session
+
+    async def get(self, url: str) -> PokeAPIResponse:
+        """
+        Send a GET request.
+
+        Args:
+        ----
+                url (str): Requested URL.
+
+        Returns:
+        -------
+                PokeAPIResponse: Status code and body of the response.
+
+        Raises:
+        ------
+                aiohttp.ClientConnectionError: If the connection fails.
+                TimeoutError: If the request takes longer than the timeout.
+
+        """
+        if self.__cache is None:
+            async with self.__get_session().get(url) as response:
+                return PokeAPIResponse(response.status, await response.read())
+
+        cached = await asyncio.to_thread(self.__cache.get, url)
+        if cached is not None and cached.is_fresh:
+            self.__cache.stats.hits += 1
+            self.__cache.stats.bytes_served += len(cached.content)
+            return PokeAPIResponse(200, cached.content)
+
+        headers = cached.conditional_headers() if cached is not None else {}
+        async with self.__get_session().get(url, headers=headers) as response:
+            status = response.status
+            content = await response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if status == 304 and cached is not None:
+            logger.debug("Cached response revalidated: %s", url)
+            self.__cache.stats.revalidations += 1
+            self.__cache.stats.bytes_served += len(cached.content)
+            await asyncio.to_thread(self.__cache.refresh, url)
+            return PokeAPIResponse(200, cached.content)
+
+        self.__cache.stats.misses += 1
+        self.__cache.stats.bytes_downloaded += len(content)
+        if status == 200:
+            await asyncio.to_thread(self.__cache.put, url, content, etag=etag, last_modified=last_modified)
+        return PokeAPIResponse(status, content)
+
+    async def close(self) -> None:
+        """Close the shared session, its connections and the cache."""
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+        self.__loop = None
+        if self.__cache is not None:
+            self.__cache.close()
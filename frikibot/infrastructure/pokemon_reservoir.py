@@ -0,0 +1,119 @@
+"""Reservoir of pre-rolled Pokémon."""
+
+import asyncio
+import collections
+import logging
+from collections.abc import Awaitable, Callable
+
+from frikibot.entities.pokemon import Pokemon
+from frikibot.shared.exceptions import NatureFetchError, VarietyDetailsFetchError, VarietyFetchError
+from frikibot.shared.global_variables import RESERVOIR_CONCURRENCY, RESERVOIR_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class ReservoirStats:
+    """Counters of a PokemonReservoir."""
+
+    __slots__ = ("refill_failures", "refills", "served", "underruns")
+
+    def __init__(self) -> None:
+        """Initialize every counter to zero."""
+        self.served = 0
+        self.underruns = 0
+        self.refills = 0
+        self.refill_failures = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class PokemonReservoir:
+    """
+    Reservoir of pre-rolled Pokémon.
+
+    A roll does not depend on the trainer who receives it, so the reservoir keeps some
+    of them ready in memory and refills itself in the background. When it is empty
+    (an underrun), the Pokémon is rolled on demand.
+    """
+
+    def __init__(self, roll: Callable[[], Awaitable[Pokemon]], *, size: int = RESERVOIR_SIZE, concurrency: int = RESERVOIR_CONCURRENCY):
+        """
+        Initialize an empty reservoir.
+
+        Args:
+        ----
+            roll (Callable[[], Awaitable[Pokemon]]): Coroutine function rolling a Pokémon.
+            size (int): Number of Pokémon to keep ready.
+            concurrency (int): Maximum number of rolls running at the same time to refill the reservoir.
+
+        """
+        self.__roll = roll
+        self.__size = size
+        self.__concurrency = max(concurrency, 1)
+        self.__rolls: collections.deque[Pokemon] = collections.deque()
+        self.__refills: set[asyncio.Task[bool]] = set()
+        self.__running = False
+        self.stats = ReservoirStats()
+
+    def __len__(self) -> int:
+        """Return the number of Pokémon ready."""
+        return len(self.__rolls)
+
+    def start(self) -> None:
+        """Start filling the reservoir in the background. Must be called inside the event loop."""
+        self.__running = True
+        self.__schedule_refills()
+        logger.info("Pokémon reservoir started. Size: %d, concurrency: %d", self.__size, self.__concurrency)
+
+    async def stop(self) -> None:
+        """Stop refilling the reservoir and cancel the rolls in progress."""
+        self.__running = False
+        for task in self.__refills:
+            task.cancel()
+        await asyncio.gather(*self.__refills, return_exceptions=True)
+        logger.info("Pokémon reservoir stopped. Stats: %s", self.stats.as_dict())
+
+    async def pop(self) -> Pokemon:
+        """
+        Take a Pokémon from the reservoir, rolling it on demand if the reservoir is empty.
+
+        Returns
+        -------
+            Pokemon: Rolled Pokémon, not bound to any trainer yet.
+
+        """
+        if self.__rolls:
+            pokemon = self.__rolls.popleft()
+        else:
+            self.stats.underruns += 1
+            logger.info("Pokémon reservoir underrun")
+            pokemon = await self.__roll()
+        self.stats.served += 1
+        self.__schedule_refills()
+        return pokemon
+
+    def __schedule_refills(self) -> None:
+        """Launch background rolls until the reservoir is full or the concurrency limit is reached."""
+        while self.__running and len(self.__rolls) + len(self.__refills) < self.__size and len(self.__refills) < self.__concurrency:
+            task = asyncio.create_task(self.__refill())
+            self.__refills.add(task)
+            task.add_done_callback(self.__on_refill_done)
+
+    async def __refill(self) -> bool:
+        """Roll a Pokémon into the reservoir and return if it succeeded."""
+        try:
+            self.__rolls.append(await self.__roll())
+        except (VarietyFetchError, VarietyDetailsFetchError, NatureFetchError):
+            self.stats.refill_failures += 1
+            logger.exception("Pokémon reservoir could not be refilled")
+            return False
+        self.stats.refills += 1
+        return True
+
+    def __on_refill_done(self, task: "asyncio.Task[bool]") -> None:
+        """Forget a finished refill and keep refilling while rolls succeed."""
+        self.__refills.discard(task)
+        if not task.cancelled() and task.exception() is None and task.result():
+            self.__schedule_refills()
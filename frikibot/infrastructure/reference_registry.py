@@ -0,0 +1,91 @@
+"""Registry of the PokeAPI reference data used by every roll."""
+
+import asyncio
+import contextlib
+import logging
+from secrets import randbelow
+
+from frikibot.domain.pokemon_data_source import PokemonDataSource
+from frikibot.entities.nature import Nature
+from frikibot.shared.exceptions import NatureFetchError, VarietyDetailsFetchError, VarietyFetchError
+from frikibot.shared.global_variables import MAX_INDEX, REFERENCE_REFRESH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceRegistry:
+    """
+    Registry of the PokeAPI reference data used by every roll.
+
+    Loads every nature and the number of species once, serves random natures and
+    species indices from memory and refreshes them in the background. Until the first
+    load succeeds, species indices go up to MAX_INDEX and natures are fetched from the source.
+    """
+
+    def __init__(self, source: PokemonDataSource, *, refresh_interval: float = REFERENCE_REFRESH_INTERVAL) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+        ----
+            source (PokemonDataSource): Source of the reference data.
+            refresh_interval (float): Seconds between refreshes.
+
+        """
+        self.__source = source
+        self.__refresh_interval = refresh_interval
+        self.__natures: tuple[Nature, ...] = ()
+        self.__species_count = MAX_INDEX
+        self.__refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def species_count(self) -> int:
+        """Return the number of species, which is also the Pokédex number of the last one."""
+        return self.__species_count
+
+    @property
+    def natures(self) -> tuple[Nature, ...]:
+        """Return every loaded nature."""
+        return self.__natures
+
+    async def load(self) -> None:
+        """Load the reference data from the source, keeping the current data if it fails."""
+        try:
+            natures, species_count = await asyncio.gather(self.__source.fetch_natures(), self.__source.fetch_species_count())
+        except (NatureFetchError, VarietyFetchError, VarietyDetailsFetchError):
+            logger.exception("Reference data could not be loaded")
+            return
+        if natures:
+            self.__natures = tuple(natures)
+        if species_count:
+            self.__species_count = species_count
+        logger.info("Reference data loaded. Natures: %d, species: %d", len(self.__natures), self.__species_count)
+
+    async def start(self) -> None:
+        """Load the reference data and keep refreshing it in the background. Must be called inside the event loop."""
+        await self.load()
+        self.__refresh_task = asyncio.create_task(self.__refresh_periodically())
+
+    async def stop(self) -> None:
+        """Stop refreshing the reference data."""
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__refresh_task
+            self.__refresh_task = None
+
+    async def __refresh_periodically(self) -> None:
+        """Reload the reference data every refresh interval."""
+        while True:
+            await asyncio.sleep(self.__refresh_interval)
+            await self.load()
+
+    def random_species_index(self) -> int:
+        """Return the Pokédex number of a random species."""
+        return randbelow(self.__species_count) + 1
+
+    async def random_nature(self) -> Nature:
+        """Return a random nature, from memory once the natures are loaded."""
+        if not self.__natures:
+            return await self.__source.fetch_random_nature()
+        return self.__natures[randbelow(len(self.__natures))]
@@ -0,0 +1,108 @@
+"""Local store of PokeAPI reference data."""
+
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any
+
+from frikibot.shared.global_variables import REFERENCE_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resource (
+    path TEXT PRIMARY KEY,
+    payload BLOB NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class ReferenceStore:
+    """
+    Local store of PokeAPI reference data.
+
+    Resources are stored by their host-independent path (like 'pokemon-species/447')
+    as zlib-compressed JSON, already reduced to the fields the bot uses.
+    """
+
+    def __init__(self, path: str = REFERENCE_DB_PATH):
+        """
+        Initialize the store. The SQLite file is opened on first use.
+
+        Args:
+        ----
+                path (str): Path of the SQLite file.
+
+        """
+        self.__path = path
+        self.__connection: sqlite3.Connection | None = None
+        self.__lock = threading.Lock()
+
+    def __get_connection(self) -> sqlite3.Connection:
+        """Return the connection to the SQLite file, opening it if needed."""
+        if self.__connection is None:
+            if self.__path != ":memory:":
+                Path(self.__path).parent.mkdir(parents=True, exist_ok=True)
+            self.__connection = sqlite3.connect(self.__path, check_same_thread=False)
+            self.__connection.execute(_SCHEMA)
+            logger.info("Reference store opened at %s", self.__path)
+        return self.__connection
+
+    def get(self, path: str) -> Any:
+        """
+        Get a resource.
+
+        Args:
+        ----
+                path (str): Resource path, like 'nature/3'.
+
+        Returns:
+        -------
+                Any: Decoded resource, or None if it is not stored.
+
+        """
+        with self.__lock:
+            row = self.__get_connection().execute("SELECT payload FROM resource WHERE path = ?", (path,)).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def put_many(self, resources: dict[str, Any]) -> None:
+        """
+        Store several resources in a single transaction.
+
+        Args:
+        ----
+                resources (dict[str, Any]): Resources to store by path.
+
+        """
+        rows = [(path, zlib.compress(json.dumps(data, separators=(",", ":")).encode())) for path, data in resources.items()]
+        with self.__lock:
+            connection = self.__get_connection()
+            connection.executemany("INSERT OR REPLACE INTO resource (path, payload) VALUES (?, ?)", rows)
+            connection.commit()
+
+    def get_ids(self, endpoint: str) -> list[int]:
+        """
+        Get the ids of every stored resource of an endpoint.
+
+        Args:
+        ----
+                endpoint (str): Endpoint of the resources, like 'nature'.
+
+        Returns:
+        -------
+                list[int]: Sorted ids of the resources.
+
+        """
+        with self.__lock:
+            rows = self.__get_connection().execute("SELECT path FROM resource WHERE path LIKE ?", (f"{endpoint}/%",)).fetchall()
+        return sorted(int(path.rsplit("/", 1)[1]) for (path,) in rows if path.rsplit("/", 1)[1].isdigit())
+
+    def close(self) -> None:
+        """Close the SQLite file."""
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from frikibot.db.models import pokemon
 from frikibot.domain import pokemon_repository
+from frikibot.infrastructure.sqlalchemy_trainer_stats_repository import pokemon_row, trainer_stats_increments
 
 
 class SQLAlchemyPokemonRepository(pokemon_repository.PokemonRepository):
@@ -16,7 +17,7 @@ class SQLAlchemyPokemonRepository(pokemon_repository.PokemonRepository):
 
     def add(self, pokemon: pokemon.Pokemon) -> None:
         """
-        Add a Pokemon to the repository.
+        Add a Pokemon to the repository, updating the stats of its trainer in the same transaction.
 
         Args:
         ----
@@ -25,6 +26,8 @@ class SQLAlchemyPokemonRepository(pokemon_repository.PokemonRepository):
         """
         try:
             self.session.add(pokemon)
+            for statement in trainer_stats_increments([pokemon_row(pokemon)]):
+                self.session.execute(statement)
             self.session.commit()
         except sqlalchemy.exc.SQLAlchemyError:
             self.session.rollback()
@@ -47,3 +50,74 @@ class SQLAlchemyPokemonRepository(pokemon_repository.PokemonRepository):
         except sqlalchemy.exc.SQLAlchemyError:
             self.session.rollback()
             return []
+
+    def count_by_trainer(self, trainer_code: str) -> int:
+        """
+        Count the Pokemons of a specific trainer.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+
+        Returns:
+        -------
+            int: Number of Pokemons owned by the trainer.
+
+        """
+        try:
+            return self.session.query(sqlalchemy.func.count(pokemon.Pokemon.id)).filter(pokemon.Pokemon.author_code == trainer_code).scalar() or 0
+        except sqlalchemy.exc.SQLAlchemyError:
+            self.session.rollback()
+            return 0
+
+    def get_page_after(self, trainer_code: str, after_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that follow a given one, oldest first.
+
+        Seeks on (author_code, id) instead of using an offset, so every page costs the same.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            after_id (int | None): ID of the last Pokemon of the previous page, None for the first page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
+        query = self.session.query(pokemon.Pokemon).filter(pokemon.Pokemon.author_code == trainer_code)
+        if after_id is not None:
+            query = query.filter(pokemon.Pokemon.id > after_id)
+        try:
+            return query.order_by(pokemon.Pokemon.id).limit(limit).all()
+        except sqlalchemy.exc.SQLAlchemyError:
+            self.session.rollback()
+            return []
+
+    def get_page_before(self, trainer_code: str, before_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that precede a given one, oldest first.
+
+        Seeks on (author_code, id) backwards instead of using an offset, so every page costs the same.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            before_id (int | None): ID of the first Pokemon of the next page, None for the last page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
+        query = self.session.query(pokemon.Pokemon).filter(pokemon.Pokemon.author_code == trainer_code)
+        if before_id is not None:
+            query = query.filter(pokemon.Pokemon.id < before_id)
+        try:
+            return query.order_by(pokemon.Pokemon.id.desc()).limit(limit).all()[::-1]
+        except sqlalchemy.exc.SQLAlchemyError:
+            self.session.rollback()
+            return []
@@ -1,17 +1,20 @@
 """SQLAlchemy implementation of TrainerRepository."""
 
 import sqlalchemy
+from sqlalchemy.dialects.sqlite import insert
 
 from frikibot.db.models.trainer import Trainer
 from frikibot.domain.trainer_repository import TrainerRepository
+from frikibot.infrastructure.known_trainer_codes import KnownTrainerCodes
 
 
 class SQLAlchemyTrainerRepository(TrainerRepository):
     """Concrete implementation of TrainerRepository using SQLAlchemy."""
 
-    def __init__(self, session):
-        """Initialize the repository with a SQLAlchemy session."""
+    def __init__(self, session, known_codes: KnownTrainerCodes | None = None):
+        """Initialize the repository with a SQLAlchemy session and, optionally, codes known to be registered."""
         self.session = session
+        self.known_codes = known_codes if known_codes is not None else KnownTrainerCodes()
 
     def add(self, trainer):
         """
@@ -28,6 +31,31 @@ class SQLAlchemyTrainerRepository(TrainerRepository):
         except sqlalchemy.exc.SQLAlchemyError:
             self.session.rollback()
 
+    def upsert(self, trainer_code: str, trainer_name: str) -> None:
+        """
+        Register a trainer unless a trainer with the same code already exists.
+
+        Known codes are skipped without querying the database. Otherwise a single
+        INSERT ... ON CONFLICT DO NOTHING registers the trainer, so concurrent
+        rolls of a new trainer cannot insert it twice.
+
+        Args:
+        ----
+            trainer_code (str): The Trainer's unique code.
+            trainer_name (str): The Trainer's name.
+
+        """
+        if trainer_code in self.known_codes:
+            return
+        statement = insert(Trainer).values(trainer_code=trainer_code, trainer_name=trainer_name, enabled=True)
+        try:
+            self.session.execute(statement.on_conflict_do_nothing(index_elements=["trainer_code"]))
+            self.session.commit()
+        except sqlalchemy.exc.SQLAlchemyError:
+            self.session.rollback()
+            return
+        self.known_codes.add(trainer_code)
+
     def get_by_code(self, trainer_code: str) -> Trainer | None:
         """
         Get a Trainer by their ID.
@@ -0,0 +1,137 @@
+"""SQLAlchemy implementation of TrainerStatsRepository."""
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy.dialects.sqlite import Insert, insert
+from sqlalchemy.orm import Session
+
+from frikibot.db.models import pokemon
+from frikibot.db.models.trainer_stats import TrainerStats as TrainerStatsModel
+from frikibot.db.models.trainer_stats import TrainerStatsCount
+from frikibot.domain.trainer_stats_repository import TrainerStatsRepository
+from frikibot.entities.trainer_stats import TrainerStats
+
+REBUILD_STATEMENTS = (
+    "DELETE FROM trainer_stats",
+    "DELETE FROM trainer_stats_count",
+    "INSERT INTO trainer_stats (author_code, total, shiny) SELECT author_code, count(*), sum(shiny) FROM pokemon GROUP BY author_code",
+    "INSERT INTO trainer_stats_count (author_code, category, value, count)"
+    " SELECT author_code, 'type', pokemon_type, count(*) FROM ("
+    "  SELECT author_code, first_type AS pokemon_type FROM pokemon UNION ALL SELECT author_code, second_type FROM pokemon"
+    " ) WHERE pokemon_type IS NOT NULL GROUP BY author_code, pokemon_type"
+    " UNION ALL"
+    " SELECT author_code, 'nature', nature_name, count(*) FROM pokemon WHERE nature_name IS NOT NULL GROUP BY author_code, nature_name",
+)
+
+
+def pokemon_row(model: pokemon.Pokemon) -> dict[str, Any]:
+    """
+    Get the column values of a Pokémon, as inserted in the pokemon table.
+
+    Args:
+    ----
+        model (pokemon.Pokemon): Pokémon to insert.
+
+    Returns:
+    -------
+        dict[str, Any]: Values of every column but the primary key.
+
+    """
+    return {column.name: getattr(model, column.name) for column in pokemon.Pokemon.__table__.columns if not column.primary_key}
+
+
+def trainer_stats_increments(rows: Iterable[Mapping[str, Any]]) -> list[Insert]:
+    """
+    Build the upserts adding some inserted Pokémon to the stats of their trainers.
+
+    Meant to run in the transaction of the insert, so stats never drift from the collection.
+
+    Args:
+    ----
+        rows (Iterable[Mapping[str, Any]]): Column values of the inserted Pokémon.
+
+    Returns:
+    -------
+        list[Insert]: Statements to execute, none if there are no rows.
+
+    """
+    totals: Counter[str] = Counter()
+    shinies: Counter[str] = Counter()
+    counts: Counter[tuple[str, str, str]] = Counter()
+    for row in rows:
+        author_code = row["author_code"]
+        totals[author_code] += 1
+        shinies[author_code] += bool(row.get("shiny"))
+        for category, value in (("type", row.get("first_type")), ("type", row.get("second_type")), ("nature", row.get("nature_name"))):
+            if value:
+                counts[(author_code, category, value)] += 1
+    if not totals:
+        return []
+
+    stats = insert(TrainerStatsModel).values([{"author_code": code, "total": total, "shiny": shinies[code]} for code, total in totals.items()])
+    statements = [
+        stats.on_conflict_do_update(
+            index_elements=["author_code"],
+            set_={"total": TrainerStatsModel.total + stats.excluded.total, "shiny": TrainerStatsModel.shiny + stats.excluded.shiny},
+        )
+    ]
+    if counts:
+        count_rows = [{"author_code": code, "category": category, "value": value, "count": count} for (code, category, value), count in counts.items()]
+        stats_counts = insert(TrainerStatsCount).values(count_rows)
+        statements.append(
+            stats_counts.on_conflict_do_update(
+                index_elements=["author_code", "category", "value"],
+                set_={"count": TrainerStatsCount.count + stats_counts.excluded.count},
+            )
+        )
+    return statements
+
+
+class SQLAlchemyTrainerStatsRepository(TrainerStatsRepository):
+    """Concrete implementation of TrainerStatsRepository using SQLAlchemy."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize the repository with a SQLAlchemy session."""
+        self.session = session
+
+    def get_by_trainer(self, trainer_code: str) -> TrainerStats:
+        """
+        Get the stats of the collection of a trainer with two primary key lookups.
+
+        Args:
+        ----
+            trainer_code (str): The Trainer's unique code.
+
+        Returns:
+        -------
+            TrainerStats: Stats of the trainer, empty if they have no Pokémon.
+
+        """
+        totals = self.session.execute(
+            sqlalchemy.select(TrainerStatsModel.total, TrainerStatsModel.shiny).filter(TrainerStatsModel.author_code == trainer_code)
+        ).first()
+        if totals is None:
+            return TrainerStats()
+        columns = (TrainerStatsCount.category, TrainerStatsCount.value, TrainerStatsCount.count)
+        counts = self.session.execute(sqlalchemy.select(*columns).filter(TrainerStatsCount.author_code == trainer_code))
+        breakdown: dict[str, dict[str, int]] = {"type": {}, "nature": {}}
+        for category, value, count in counts:
+            breakdown.setdefault(category, {})[value] = count
+        return TrainerStats(total=totals.total, shiny=totals.shiny, types=breakdown["type"], natures=breakdown["nature"])
+
+    def rebuild(self) -> int:
+        """
+        Recompute the stats of every trainer from their Pokémon, in a single transaction.
+
+        Returns
+        -------
+            int: Number of trainers with stats.
+
+        """
+        for statement in REBUILD_STATEMENTS:
+            self.session.execute(sqlalchemy.text(statement))
+        self.session.commit()
+        return self.session.execute(sqlalchemy.select(sqlalchemy.func.count()).select_from(TrainerStatsModel)).scalar_one()
@@ -0,0 +1,296 @@
+"""Pokemon repository that writes in batches from a background thread."""
+
+import atexit
+import contextlib
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from frikibot.db.models import pokemon
+from frikibot.domain import pokemon_repository
+from frikibot.infrastructure import database
+from frikibot.infrastructure.sqlalchemy_pokemon_repository import SQLAlchemyPokemonRepository
+from frikibot.infrastructure.sqlalchemy_trainer_stats_repository import pokemon_row, trainer_stats_increments
+from frikibot.shared.global_variables import WRITE_BEHIND_BATCH_SIZE, WRITE_BEHIND_FLUSH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+CLOSE_RETRIES = 3
+
+
+class WriteBehindStats:
+    """Counters of a WriteBehindPokemonRepository."""
+
+    __slots__ = ("batches", "failures", "max_batch_size", "max_flush_latency", "pending", "rows_written", "total_flush_latency")
+
+    def __init__(self) -> None:
+        """Initialize every counter to zero."""
+        self.batches = 0
+        self.rows_written = 0
+        self.max_batch_size = 0
+        self.total_flush_latency = 0.0
+        self.max_flush_latency = 0.0
+        self.failures = 0
+        self.pending = 0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class WriteBehindPokemonRepository(pokemon_repository.PokemonRepository):
+    """
+    Pokemon repository that keeps rolls in memory and writes them in batches.
+
+    A background thread inserts the queued rolls with a single Core insert and a
+    single transaction per batch, along with the stats of their trainers, once batch_size rolls are queued or the oldest one
+    has waited flush_interval seconds. Failed batches are kept and retried. Reads
+    wait for the queued rolls to be written, and close() writes everything left.
+    """
+
+    def __init__(
+        self,
+        engine: Engine = database.engine,
+        *,
+        read_engine: Engine | None = None,
+        batch_size: int = WRITE_BEHIND_BATCH_SIZE,
+        flush_interval: float = WRITE_BEHIND_FLUSH_INTERVAL,
+    ) -> None:
+        """
+        Initialize the repository. The writer starts with start().
+
+        Args:
+        ----
+            engine (Engine): Engine of the database.
+            read_engine (Engine | None): Engine used by reads, the main engine if None.
+            batch_size (int): Rolls that trigger a write.
+            flush_interval (float): Seconds a roll may wait before being written.
+
+        """
+        self.__engine = engine
+        self.__read_engine = read_engine or engine
+        self.__batch_size = batch_size
+        self.__flush_interval = flush_interval
+        self.__condition = threading.Condition()
+        self.__queue: list[dict[str, Any]] = []
+        self.__oldest = 0.0
+        self.__enqueued = 0
+        self.__written = 0
+        self.__flush_target = 0
+        self.__closing = False
+        self.__writer: threading.Thread | None = None
+        self.stats = WriteBehindStats()
+
+    def start(self) -> None:
+        """Start the background writer."""
+        if self.__writer is not None:
+            return
+        self.__closing = False
+        self.__writer = threading.Thread(target=self.__write_loop, name="pokemon-writer", daemon=True)
+        self.__writer.start()
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Write every queued roll and stop the background writer."""
+        if self.__writer is None:
+            return
+        with self.__condition:
+            self.__closing = True
+            self.__condition.notify_all()
+        self.__writer.join()
+        self.__writer = None
+        atexit.unregister(self.close)
+        logger.info("Pokemon writer stopped. Stats: %s", self.stats.as_dict())
+
+    def add(self, pokemon: pokemon.Pokemon) -> None:
+        """
+        Queue a Pokemon to be written.
+
+        Args:
+        ----
+            pokemon (pokemon.Pokemon): The Pokemon to add.
+
+        """
+        row = pokemon_row(pokemon)
+        with self.__condition:
+            if not self.__queue:
+                self.__oldest = time.monotonic()
+            self.__queue.append(row)
+            self.__enqueued += 1
+            self.stats.pending = len(self.__queue)
+            if len(self.__queue) == 1 or len(self.__queue) >= self.__batch_size:
+                self.__condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every roll queued so far is written.
+
+        Without a running writer, the rolls are written by the calling thread.
+
+        Args:
+        ----
+            timeout (float | None): Maximum seconds to wait.
+
+        Returns:
+        -------
+            bool: Whether every roll was written in time.
+
+        """
+        with self.__condition:
+            target = self.__enqueued
+            self.__flush_target = max(self.__flush_target, target)
+            if self.__writer is not None:
+                self.__condition.notify_all()
+                return self.__condition.wait_for(lambda: self.__written >= target, timeout)
+        while self.__write_next_batch():
+            pass
+        return self.__written >= target
+
+    def get_all_by_trainer(self, trainer_code: str) -> list[pokemon.Pokemon]:
+        """
+        Get all Pokemons for a specific trainer, including the queued ones.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: A list of Pokemons owned by the trainer.
+
+        """
+        with self.__reader() as reader:
+            return reader.get_all_by_trainer(trainer_code)
+
+    def count_by_trainer(self, trainer_code: str) -> int:
+        """
+        Count the Pokemons of a specific trainer, including the queued ones.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+
+        Returns:
+        -------
+            int: Number of Pokemons owned by the trainer.
+
+        """
+        with self.__reader() as reader:
+            return reader.count_by_trainer(trainer_code)
+
+    def get_page_after(self, trainer_code: str, after_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that follow a given one, oldest first, including the queued ones.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            after_id (int | None): ID of the last Pokemon of the previous page, None for the first page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
+        with self.__reader() as reader:
+            return reader.get_page_after(trainer_code, after_id, limit)
+
+    def get_page_before(self, trainer_code: str, before_id: int | None, limit: int) -> list[pokemon.Pokemon]:
+        """
+        Get the Pokemons of a trainer that precede a given one, oldest first, including the queued ones.
+
+        Args:
+        ----
+            trainer_code (str): The unique code of the trainer.
+            before_id (int | None): ID of the first Pokemon of the next page, None for the last page.
+            limit (int): Maximum number of Pokemons.
+
+        Returns:
+        -------
+            list[pokemon.Pokemon]: Page of Pokemons ordered by ID.
+
+        """
+        with self.__reader() as reader:
+            return reader.get_page_before(trainer_code, before_id, limit)
+
+    @contextlib.contextmanager
+    def __reader(self) -> Iterator[SQLAlchemyPokemonRepository]:
+        """Flush the queued rolls and yield a repository reading with a session of its own."""
+        self.flush(self.__flush_interval * 5)
+        with Session(self.__read_engine) as session:
+            yield SQLAlchemyPokemonRepository(session)
+
+    def __write_loop(self) -> None:
+        """Write batches until closed, then write what is left."""
+        failures_on_close = 0
+        while True:
+            with self.__condition:
+                if not self.__closing and not self.__batch_due():
+                    self.__condition.wait(self.__time_to_flush())
+                    continue
+                if not self.__queue:
+                    return
+            if self.__write_next_batch():
+                continue
+            if self.__closing:
+                failures_on_close += 1
+                if failures_on_close >= CLOSE_RETRIES:
+                    logger.error("Giving up on %d queued Pokémon after %d failed writes", len(self.__queue), failures_on_close)
+                    return
+            time.sleep(self.__flush_interval)
+
+    def __batch_due(self) -> bool:
+        """Whether the queued rolls must be written now. Must hold the condition."""
+        if not self.__queue:
+            return False
+        return len(self.__queue) >= self.__batch_size or self.__written < self.__flush_target or time.monotonic() - self.__oldest >= self.__flush_interval
+
+    def __time_to_flush(self) -> float | None:
+        """Seconds until the oldest queued roll must be written. Must hold the condition."""
+        if not self.__queue:
+            return None
+        return max(0.0, self.__oldest + self.__flush_interval - time.monotonic())
+
+    def __write_next_batch(self) -> bool:
+        """
+        Write the oldest batch of queued rolls in a single transaction.
+
+        Returns
+        -------
+            bool: Whether a batch was written.
+
+        """
+        with self.__condition:
+            batch = self.__queue[: self.__batch_size]
+        if not batch:
+            return False
+        start = time.perf_counter()
+        try:
+            with self.__engine.begin() as connection:
+                connection.execute(sqlalchemy.insert(pokemon.Pokemon), batch)
+                for statement in trainer_stats_increments(batch):
+                    connection.execute(statement)
+        except sqlalchemy.exc.SQLAlchemyError:
+            self.stats.failures += 1
+            logger.exception("Could not write a batch of %d Pokémon, it will be retried", len(batch))
+            return False
+        latency = time.perf_counter() - start
+        with self.__condition:
+            del self.__queue[: len(batch)]
+            self.__written += len(batch)
+            self.stats.batches += 1
+            self.stats.rows_written += len(batch)
+            self.stats.max_batch_size = max(self.stats.max_batch_size, len(batch))
+            self.stats.total_flush_latency += latency
+            self.stats.max_flush_latency = max(self.stats.max_flush_latency, latency)
+            self.stats.pending = len(self.__queue)
+            self.__condition.notify_all()
+        logger.debug("Wrote %d Pokémon in %.1fms", len(batch), latency * 1000)
+        return True
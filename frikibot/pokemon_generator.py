@@ -7,15 +7,22 @@ a random Pokémon.
 
 import enum
 import logging
+import random
 from secrets import randbelow
-from typing import Any
 
-from discord.ext import commands
-
-from frikibot.controller.pokeapi_controller import PokeAPIController
+from frikibot.controller.offline_pokeapi_controller import OfflinePokeAPIController
+from frikibot.controller.pokeapi_controller import AsyncPokeAPIController
+from frikibot.domain.pokemon_data_source import PokemonDataSource
+from frikibot.entities.nature import Nature
 from frikibot.entities.pokemon import Pokemon
 from frikibot.entities.stats import Stats
-from frikibot.shared.global_variables import MAX_INDEX
+from frikibot.entities.variety_details import VarietyDetails
+from frikibot.infrastructure.pokeapi_cache import PokeAPICache
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
+from frikibot.infrastructure.reference_registry import ReferenceRegistry
+from frikibot.infrastructure.reference_store import ReferenceStore
+from frikibot.shared.fetch_graph import FetchGraph
+from frikibot.shared.global_variables import POKEAPI_SOURCE
 
 
 class RequestTypes(enum.StrEnum):
@@ -35,50 +42,65 @@ class RequestTypes(enum.StrEnum):
 logger = logging.getLogger(name="PkGenerator")
 
 # TODO: Apply DI
-pokeapi_controller = PokeAPIController()
+pokeapi_client = PokeAPIClient(cache=PokeAPICache())
+pokeapi_controller: PokemonDataSource = OfflinePokeAPIController(ReferenceStore()) if POKEAPI_SOURCE == "offline" else AsyncPokeAPIController(pokeapi_client)
+reference_registry = ReferenceRegistry(pokeapi_controller)
 
 
-def generate_random_pokemon(
-    ctx: commands.Context[Any],
-    color: str,
-) -> Pokemon:
+def roll_color() -> str:
     """
-    Generate a random Pokémon and return a message with an embed object.
-
-    Args:
-    ----
-        ctx (commands.Context): Context of the command
-        color (str): Representation of pokémon color. Shiny or normal
+    Roll the color of a Pokémon, with a 10% chance of being shiny.
 
-    Returns:
+    Returns
     -------
-        Tuple[discord.Embed, str]: Discord embed and message text
+        str: Pokémon color, ["default", "shiny"]
 
     """
-    pokemon_index = randbelow(MAX_INDEX - 1) + 1
+    return "shiny" if random.randint(0, 101) <= 10 else "default"  # noqa: S311
 
-    varieties = pokeapi_controller.fetch_pokemon_varieties(pokemon_index)
-    detailed_variety = pokeapi_controller.fetch_variety_details(varieties[randbelow(len(varieties))])
 
-    logger.info("VarietyData created")
+async def generate_random_pokemon() -> Pokemon:
+    """
+    Generate a random Pokémon not bound to any trainer yet.
+
+    The color is rolled here too, so the whole Pokémon can be generated before
+    knowing who is going to receive it.
 
-    nature = pokeapi_controller.fetch_random_nature()
+    Returns
+    -------
+        Pokemon: Generated Pokémon with an empty author_code
 
+    """
+    color = roll_color()
+    pokemon_index = reference_registry.random_species_index()
+
+    results = await (
+        FetchGraph("Pokemon")
+        .add("varieties", lambda: pokeapi_controller.fetch_pokemon_varieties(pokemon_index))
+        .add("variety", lambda varieties: pokeapi_controller.fetch_variety_details(varieties[randbelow(len(varieties))]), depends_on=("varieties",))
+        .add("nature", reference_registry.random_nature)
+        .run()
+    )
+    detailed_variety: VarietyDetails = results["variety"]
+    nature: Nature = results["nature"]
+
+    logger.info("VarietyData created")
     logger.info("Nature created: %s", nature)
 
     # IDEA: Extract the creation to a Factory Method
-    pokemon_stats = Stats(detailed_variety.combat_stats, nature.decreased, nature.increased)
+    pokemon_stats = Stats(detailed_variety.stats, nature.decreased, nature.increased)
 
     # TODO: Extract the creation of the Pokémon to a Factory Method/Builder
     return Pokemon(
         name=detailed_variety.name,
         list_index=pokemon_index,
-        author_code=str(ctx.author.id),
+        author_code="",
         nature=nature,
-        first_type=detailed_variety.types[0]["type"]["name"],
-        second_type=detailed_variety.types[1]["type"]["name"] if len(detailed_variety.types) > 1 else "none",
+        first_type=detailed_variety.types[0],
+        second_type=detailed_variety.types[1] if len(detailed_variety.types) > 1 else "none",
         available_moves=detailed_variety.available_moves,
         available_abilities=detailed_variety.available_abilities,
         stats=pokemon_stats,
         sprite=detailed_variety.get_official_artwork_sprite(color),
+        color=color,
     )
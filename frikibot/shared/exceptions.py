@@ -23,3 +23,19 @@ class NatureFetchError(Exception):
     def __init__(self, *args: object):
         """Init."""
         super().__init__(*args)
+
+
+class GenerationTimeoutError(Exception):
+    """Raises when a task of the generation executor misses its deadline."""
+
+    def __init__(self, *args: object):
+        """Init."""
+        super().__init__(*args)
+
+
+class GenerationQueueFullError(Exception):
+    """Raises when the queue of the generation executor is full."""
+
+    def __init__(self, *args: object):
+        """Init."""
+        super().__init__(*args)
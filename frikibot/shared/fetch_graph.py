@@ -0,0 +1,119 @@
+"""Dependency graph of asynchronous fetches."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class _FetchNode:
+    """Fetch of a FetchGraph."""
+
+    __slots__ = ("depends_on", "fetch", "finished_at", "started_at")
+
+    def __init__(self, fetch: Callable[..., Awaitable[Any]], depends_on: tuple[str, ...]):
+        """Initialize a node with its fetch and the names of the fetches it depends on."""
+        self.fetch = fetch
+        self.depends_on = depends_on
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+
+class FetchGraph:
+    """
+    Dependency graph of asynchronous fetches.
+
+    Every fetch starts as soon as the fetches it depends on have finished and receives
+    their results as positional arguments, so independent branches run concurrently and
+    the wall time is the critical path instead of the sum of every fetch.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize an empty graph.
+
+        Args:
+        ----
+            name (str): Name of the graph, used in logs.
+
+        """
+        self.__name = name
+        self.__nodes: dict[str, _FetchNode] = {}
+
+    def add(self, name: str, fetch: Callable[..., Awaitable[Any]], *, depends_on: tuple[str, ...] = ()) -> "FetchGraph":
+        """
+        Add a fetch to the graph.
+
+        Args:
+        ----
+            name (str): Unique name of the fetch.
+            fetch (Callable[..., Awaitable]): Coroutine function receiving the results of its dependencies.
+            depends_on (tuple[str, ...]): Names of fetches already in the graph whose results are needed.
+
+        Returns:
+        -------
+            FetchGraph: The graph itself.
+
+        """
+        if name in self.__nodes:
+            raise ValueError(f"Fetch {name} is already in graph {self.__name}")
+        missing = [dependency for dependency in depends_on if dependency not in self.__nodes]
+        if missing:
+            raise ValueError(f"Fetch {name} depends on unknown fetches: {missing}")
+        self.__nodes[name] = _FetchNode(fetch, depends_on)
+        return self
+
+    async def run(self) -> dict[str, Any]:
+        """
+        Run every fetch of the graph.
+
+        Returns
+        -------
+            dict[str, Any]: Result of every fetch by name.
+
+        Raises
+        ------
+            Exception: The first exception raised by a fetch. Pending fetches are cancelled.
+
+        """
+        started_at = time.perf_counter()
+        tasks: dict[str, asyncio.Task[Any]] = {}
+        for name, node in self.__nodes.items():
+            tasks[name] = asyncio.create_task(self.__run_node(node, [tasks[dependency] for dependency in node.depends_on]))
+        try:
+            results = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        self.__log_timings(started_at)
+        return dict(zip(tasks, results, strict=True))
+
+    async def __run_node(self, node: _FetchNode, dependencies: list["asyncio.Task[Any]"]) -> Any:
+        """Wait for the dependencies of a node and run its fetch."""
+        arguments = [await dependency for dependency in dependencies]
+        node.started_at = time.perf_counter()
+        result = await node.fetch(*arguments)
+        node.finished_at = time.perf_counter()
+        return result
+
+    def critical_path(self) -> list[str]:
+        """Return the names of the fetches of the last run that determined its wall time."""
+        if not self.__nodes:
+            return []
+        path = [max(self.__nodes, key=lambda name: self.__nodes[name].finished_at)]
+        while self.__nodes[path[0]].depends_on:
+            path.insert(0, max(self.__nodes[path[0]].depends_on, key=lambda name: self.__nodes[name].finished_at))
+        return path
+
+    def __log_timings(self, started_at: float) -> None:
+        """Log the duration of every fetch and the critical path of the last run."""
+        total = (time.perf_counter() - started_at) * 1000
+        branches = ", ".join(
+            f"{name}={(node.finished_at - node.started_at) * 1000:.1f}ms (+{(node.started_at - started_at) * 1000:.1f}ms)"
+            for name, node in self.__nodes.items()
+        )
+        logger.info("%s fetched in %.1fms. Critical path: %s. Fetches: %s", self.__name, total, " -> ".join(self.critical_path()), branches)
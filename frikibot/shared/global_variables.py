@@ -1,5 +1,55 @@
 """Script made by David Gómez."""
 
-MAX_INDEX = 1010  # Pokedex number of the last Pokemon in Pokédex
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MAX_INDEX = 1010  # Pokedex number of the last Pokemon in Pokédex, until the reference registry loads the real one
 
 TIMEOUT = 10  # HTTP request timeout
+
+POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"  # Root of every PokeAPI endpoint
+
+POKEAPI_MAX_CONNECTIONS = 10  # Size of the keep-alive connection pool shared by PokeAPI requests
+
+POKEAPI_CACHE_PATH = os.getenv("POKEAPI_CACHE_PATH", "db/pokeapi_cache.db")  # SQLite file of the PokeAPI response cache
+
+POKEAPI_CACHE_TTL = {  # Seconds a cached response is served without revalidation, by endpoint
+    "pokemon-species": 7 * 24 * 60 * 60,
+    "pokemon": 7 * 24 * 60 * 60,
+    "nature": 30 * 24 * 60 * 60,
+}
+
+POKEAPI_CACHE_DEFAULT_TTL = 24 * 60 * 60  # TTL of endpoints missing in POKEAPI_CACHE_TTL
+
+REFERENCE_DB_PATH = os.getenv("REFERENCE_DB_PATH", "db/pokeapi_reference.db")  # SQLite file built by `python -m frikibot.dataset build`
+
+POKEAPI_SOURCE = os.getenv("POKEAPI_SOURCE", "online")  # "online" to query PokeAPI, "offline" to read only REFERENCE_DB_PATH
+
+RESERVOIR_SIZE = int(os.getenv("RESERVOIR_SIZE", "10"))  # Pokémon kept pre-rolled for -pokemon. 0 rolls every Pokémon on demand
+
+RESERVOIR_CONCURRENCY = int(os.getenv("RESERVOIR_CONCURRENCY", "2"))  # Maximum rolls generated at the same time to refill the reservoir
+
+REFERENCE_REFRESH_INTERVAL = int(os.getenv("REFERENCE_REFRESH_INTERVAL", str(24 * 60 * 60)))  # Seconds between refreshes of natures and species count
+
+GENERATION_WORKERS = int(os.getenv("GENERATION_WORKERS", "4"))  # Threads running the blocking work of commands (database, embeds)
+
+GENERATION_QUEUE_SIZE = int(os.getenv("GENERATION_QUEUE_SIZE", "100"))  # Tasks allowed to wait for a free thread before rejecting new ones
+
+GENERATION_DEADLINE = float(os.getenv("GENERATION_DEADLINE", "10"))  # Seconds a task may take, waiting included
+
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "50"))  # Rolls written to the database in a single transaction
+
+WRITE_BEHIND_FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "1"))  # Seconds a roll may wait in memory before being written
+
+TRAINER_CACHE_SIZE = int(os.getenv("TRAINER_CACHE_SIZE", "10000"))  # Trainer codes remembered as already registered
+
+DATABASE_PATH = os.getenv("DATABASE_PATH", "db/pokemon.db")  # SQLite database of trainers and their Pokémon
+
+DATABASE_READ_POOL_SIZE = int(os.getenv("DATABASE_READ_POOL_SIZE", "4"))  # Read-only connections, writes go through a single connection
+
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "16384"))  # Page cache of every connection
+
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))  # Bytes of the database file read through memory mapping
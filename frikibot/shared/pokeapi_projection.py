@@ -0,0 +1,104 @@
+"""Reduction of PokeAPI resources to the fields used by the bot."""
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Arrays of flat objects that make up most of a /pokemon document and are never used
+_UNUSED_ARRAYS = (b'"version_group_details"', b'"version_details"', b'"game_indices"')
+
+
+def project_species(data: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a pokemon-species resource to the fields used by the bot."""
+    return {
+        "varieties": [
+            {"is_default": variety["is_default"], "pokemon": {"name": variety["pokemon"]["name"], "url": variety["pokemon"]["url"]}}
+            for variety in data["varieties"]
+        ]
+    }
+
+
+def project_variety(data: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a pokemon resource to the fields used by the bot."""
+    artwork = data.get("sprites", {}).get("other", {}).get("official-artwork", {})
+    return {
+        "is_default": data.get("is_default", False),
+        "name": data.get("name"),
+        "species": {"url": data.get("species", {}).get("url", "")},
+        "abilities": [{"ability": {"name": ability["ability"]["name"]}} for ability in data.get("abilities", [])],
+        "moves": [{"move": {"name": move["move"]["name"]}} for move in data.get("moves", [])],
+        "stats": [{"base_stat": stat["base_stat"], "stat": {"name": stat["stat"]["name"]}} for stat in data.get("stats", [])],
+        "types": [{"type": {"name": pokemon_type["type"]["name"]}} for pokemon_type in data.get("types", [])],
+        "sprites": {"other": {"official-artwork": {key: artwork.get(key) for key in ("front_default", "front_shiny")}}},
+    }
+
+
+def project_nature(data: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a nature resource to the fields used by the bot."""
+    return {
+        "name": data["name"],
+        "decreased_stat": {"name": data["decreased_stat"]["name"]} if data.get("decreased_stat") else None,
+        "increased_stat": {"name": data["increased_stat"]["name"]} if data.get("increased_stat") else None,
+    }
+
+
+def _cut_arrays(content: bytes, key: bytes) -> bytes:
+    """
+    Empty every array of flat objects stored under a key, without decoding the document.
+
+    Only arrays without nested arrays are emptied, so the cut ends at their first closing bracket.
+
+    Args:
+    ----
+        content (bytes): Raw JSON document.
+        key (bytes): Quoted key of the arrays, like b'"game_indices"'.
+
+    Returns:
+    -------
+        bytes: Document with the arrays emptied.
+
+    """
+    chunks = []
+    position = 0
+    start = content.find(key)
+    while start != -1:
+        opening = content.find(b"[", start + len(key))
+        closing = content.find(b"]", opening)
+        if opening == -1 or closing == -1:
+            break
+        if content[start + len(key) : opening].strip() == b":" and content.find(b"[", opening + 1, closing) == -1:
+            chunks.append(content[position : opening + 1])
+            position = closing
+        start = content.find(key, closing)
+    chunks.append(content[position:])
+    return b"".join(chunks)
+
+
+def decode_variety(content: bytes) -> dict[str, Any]:
+    """
+    Decode a /pokemon document keeping only the fields used by the bot.
+
+    The per-version details of moves, held items and game indices are most of the
+    document, so they are cut out of the raw bytes before decoding and are never
+    turned into Python objects. If the cut document is not valid JSON, the whole
+    document is decoded instead.
+
+    Args:
+    ----
+        content (bytes): Raw body of the /pokemon response.
+
+    Returns:
+    -------
+        dict[str, Any]: Projected resource, see project_variety.
+
+    """
+    projected = content
+    for key in _UNUSED_ARRAYS:
+        projected = _cut_arrays(projected, key)
+    try:
+        return project_variety(json.loads(projected))
+    except json.JSONDecodeError:
+        logger.warning("Variety document could not be projected, decoding it whole")
+        return project_variety(json.loads(content))
@@ -0,0 +1,44 @@
+"""Helpers to work with PokeAPI URLs."""
+
+from urllib.parse import urlsplit
+
+
+def _get_segments(url: str) -> list[str]:
+    """Return the path segments of a URL that come after /api/v2/."""
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    if "v2" not in segments:
+        return []
+    return segments[segments.index("v2") + 1 :]
+
+
+def get_endpoint(url: str) -> str:
+    """
+    Get the PokeAPI endpoint of a URL.
+
+    Args:
+    ----
+            url (str): PokeAPI URL, like https://pokeapi.co/api/v2/nature/3/
+
+    Returns:
+    -------
+            str: Endpoint of the URL, like 'nature'
+
+    """
+    segments = _get_segments(url)
+    return segments[0] if segments else ""
+
+
+def get_resource_path(url: str) -> str:
+    """
+    Get the resource path of a URL, independent of the host serving it.
+
+    Args:
+    ----
+            url (str): PokeAPI URL, like https://pokeapi.co/api/v2/nature/3/ or /api/v2/nature/3/
+
+    Returns:
+    -------
+            str: Resource path of the URL, like 'nature/3'
+
+    """
+    return "/".join(_get_segments(url))
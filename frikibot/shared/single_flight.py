@@ -0,0 +1,65 @@
+"""Coalescing of identical concurrent calls."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlightStats:
+    """Counters of a SingleFlight."""
+
+    __slots__ = ("calls", "shared")
+
+    def __init__(self) -> None:
+        """Initialize every counter to zero."""
+        self.calls = 0
+        self.shared = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SingleFlight:
+    """
+    Coalescing of identical concurrent calls.
+
+    While a call for a key is in flight, every other caller asking for the same key
+    waits for it and receives its result (or its exception) instead of making its own call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a group without calls in flight."""
+        self.__in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call, or join the one already in flight for the same key.
+
+        Args:
+        ----
+            key (Hashable): Identity of the call, like the requested URL.
+            call (Callable[[], Awaitable[T]]): Coroutine function making the call.
+
+        Returns:
+        -------
+            T: Result of the call.
+
+        """
+        self.stats.calls += 1
+        task = self.__in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self.__in_flight[key] = task
+            task.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+        else:
+            self.stats.shared += 1
+            logger.debug("Joined call in flight: %s", key)
+        # Shielded so a cancelled caller does not cancel the call for the rest of them
+        return await asyncio.shield(task)
@@ -0,0 +1,51 @@
+"""Use case for fetching every nature from the PokeAPI."""
+
+import asyncio
+import functools
+from typing import Any
+
+import aiohttp
+
+from frikibot.entities.nature import Nature
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
+from frikibot.shared.exceptions import NatureFetchError
+from frikibot.shared.global_variables import POKEAPI_BASE_URL
+from frikibot.shared.single_flight import SingleFlight
+
+NATURES_LIMIT = 100  # Natures requested in a single page, more than PokeAPI has
+
+
+class AsyncFetchNaturesUseCase:
+    """Use case for fetching every nature without blocking the event loop."""
+
+    def __init__(self, client: PokeAPIClient, single_flight: SingleFlight) -> None:
+        """Initialize the use case with the PokeAPI client and the group coalescing identical requests."""
+        self.__client = client
+        self.__single_flight = single_flight
+
+    async def execute(self) -> list[Nature]:
+        """Execute the use case to fetch every nature."""
+        url = f"{POKEAPI_BASE_URL}/nature/?limit={NATURES_LIMIT}"
+        urls = await self.__single_flight.do(url, lambda: self.__fetch_urls(url))
+        return list(await asyncio.gather(*(self.__single_flight.do(nature_url, functools.partial(self.__fetch, nature_url)) for nature_url in urls)))
+
+    async def __fetch_urls(self, url: str) -> list[str]:
+        """Request the URL of every nature."""
+        response = await self.__get(url)
+        return [result["url"] for result in response["results"]]
+
+    async def __fetch(self, url: str) -> Nature:
+        """Request and parse a nature."""
+        return Nature.from_json(await self.__get(url))
+
+    async def __get(self, url: str) -> Any:
+        """Request a URL and decode its JSON body."""
+        try:
+            response = await self.__client.get(url)
+        except TimeoutError as exc:
+            raise NatureFetchError(f"Timeout error happened trying to fetch natures from {url}") from exc
+        except aiohttp.ClientError as exc:
+            raise NatureFetchError(f"Connection error trying to fetch natures from {url}") from exc
+        if response.status_code == 200:
+            return response.json()
+        raise NatureFetchError(f"Failed fetching natures from {url}. Response status code: {response.status_code}")
@@ -1,10 +1,13 @@
 """Use case to fetch all varieties of a Pokémon given its index."""
 
+import aiohttp
 import requests
 
 from frikibot.entities.variety import Variety
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
 from frikibot.shared.exceptions import VarietyFetchError
-from frikibot.shared.global_variables import TIMEOUT
+from frikibot.shared.global_variables import POKEAPI_BASE_URL, TIMEOUT
+from frikibot.shared.single_flight import SingleFlight
 
 
 class FetchPokemonVarietiesUseCase:
@@ -22,3 +25,30 @@ class FetchPokemonVarietiesUseCase:
         except requests.Timeout as exc:
             raise VarietyFetchError(f"Timeout error happened when trying to fetch pokémon: {pokemon_index}") from exc
         raise VarietyFetchError(f"Failed fetching with index {pokemon_index}. Response status code: {raw_response.status_code}")
+
+
+class AsyncFetchPokemonVarietiesUseCase:
+    """Use case to fetch all varieties of a Pokémon given its index without blocking the event loop."""
+
+    def __init__(self, client: PokeAPIClient, single_flight: SingleFlight) -> None:
+        """Initialize the use case with the PokeAPI client and the group coalescing identical requests."""
+        self.__client = client
+        self.__single_flight = single_flight
+
+    async def execute(self, pokemon_index: int) -> list[Variety]:
+        """Execute the use case to fetch Pokémon varieties."""
+        url = f"{POKEAPI_BASE_URL}/pokemon-species/{pokemon_index}/"
+        return await self.__single_flight.do(url, lambda: self.__fetch(url, pokemon_index))
+
+    async def __fetch(self, url: str, pokemon_index: int) -> list[Variety]:
+        """Request and parse the varieties of a Pokémon."""
+        try:
+            raw_response = await self.__client.get(url)
+        except TimeoutError as exc:
+            raise VarietyFetchError(f"Timeout error happened when trying to fetch pokémon: {pokemon_index}") from exc
+        except aiohttp.ClientError as exc:
+            raise VarietyFetchError(f"Connection error happened when trying to fetch pokémon: {pokemon_index}") from exc
+        if raw_response.status_code == 200:
+            json_response = raw_response.json()
+            return [Variety.from_json(v) for v in json_response["varieties"]]
+        raise VarietyFetchError(f"Failed fetching with index {pokemon_index}. Response status code: {raw_response.status_code}")
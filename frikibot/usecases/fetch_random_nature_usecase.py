@@ -2,11 +2,14 @@
 
 import random
 
+import aiohttp
 import requests
 
 from frikibot.entities.nature import Nature
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
 from frikibot.shared.exceptions import NatureFetchError
-from frikibot.shared.global_variables import TIMEOUT
+from frikibot.shared.global_variables import POKEAPI_BASE_URL, TIMEOUT
+from frikibot.shared.single_flight import SingleFlight
 
 
 class FetchRandomNatureUseCase:
@@ -24,3 +27,30 @@ class FetchRandomNatureUseCase:
             raise NatureFetchError("Connection error trying to fetch a random nature") from exc
         except requests.Timeout as exc:
             raise NatureFetchError("Timeout error happened trying to fetch a random nature.") from exc
+
+
+class AsyncFetchRandomNatureUseCase:
+    """Use case for fetching a random nature without blocking the event loop."""
+
+    def __init__(self, client: PokeAPIClient, single_flight: SingleFlight) -> None:
+        """Initialize the use case with the PokeAPI client and the group coalescing identical requests."""
+        self.__client = client
+        self.__single_flight = single_flight
+
+    async def execute(self) -> Nature:
+        """Execute the use case to fetch a random nature."""
+        nature_index = random.randint(1, 25 - 1)  # TODO: Max index should be retrieved from api  # noqa: S311
+        url = f"{POKEAPI_BASE_URL}/nature/{nature_index}/"
+        return await self.__single_flight.do(url, lambda: self.__fetch(url, nature_index))
+
+    async def __fetch(self, url: str, nature_index: int) -> Nature:
+        """Request and parse a nature."""
+        try:
+            response = await self.__client.get(url)
+        except TimeoutError as exc:
+            raise NatureFetchError("Timeout error happened trying to fetch a random nature.") from exc
+        except aiohttp.ClientError as exc:
+            raise NatureFetchError("Connection error trying to fetch a random nature") from exc
+        if response.status_code == 200:
+            return Nature.from_json(response.json())
+        raise NatureFetchError(f"Failed fetching nature {nature_index}. Response status code: {response.status_code}")
@@ -0,0 +1,34 @@
+"""Use case for fetching the number of Pokémon species from the PokeAPI."""
+
+import aiohttp
+
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
+from frikibot.shared.exceptions import VarietyFetchError
+from frikibot.shared.global_variables import POKEAPI_BASE_URL
+from frikibot.shared.single_flight import SingleFlight
+
+
+class AsyncFetchSpeciesCountUseCase:
+    """Use case for fetching the number of Pokémon species without blocking the event loop."""
+
+    def __init__(self, client: PokeAPIClient, single_flight: SingleFlight) -> None:
+        """Initialize the use case with the PokeAPI client and the group coalescing identical requests."""
+        self.__client = client
+        self.__single_flight = single_flight
+
+    async def execute(self) -> int:
+        """Execute the use case to fetch the number of species, which is also the Pokédex number of the last one."""
+        url = f"{POKEAPI_BASE_URL}/pokemon-species/?limit=1"
+        return await self.__single_flight.do(url, lambda: self.__fetch(url))
+
+    async def __fetch(self, url: str) -> int:
+        """Request the number of species."""
+        try:
+            response = await self.__client.get(url)
+        except TimeoutError as exc:
+            raise VarietyFetchError("Timeout error happened trying to fetch the number of species") from exc
+        except aiohttp.ClientError as exc:
+            raise VarietyFetchError("Connection error happened trying to fetch the number of species") from exc
+        if response.status_code == 200:
+            return int(response.json()["count"])
+        raise VarietyFetchError(f"Failed fetching the number of species. Response status code: {response.status_code}")
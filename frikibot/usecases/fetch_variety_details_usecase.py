@@ -1,11 +1,15 @@
 """Use case for fetching variety details."""
 
+import aiohttp
 import requests
 
 from frikibot.entities.variety import Variety
 from frikibot.entities.variety_details import VarietyDetails
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
 from frikibot.shared.exceptions import VarietyDetailsFetchError, VarietyFetchError
 from frikibot.shared.global_variables import TIMEOUT
+from frikibot.shared.pokeapi_projection import decode_variety
+from frikibot.shared.single_flight import SingleFlight
 
 
 class FetchVarietyDetailsUseCase:
@@ -34,3 +38,39 @@ class FetchVarietyDetailsUseCase:
         except requests.Timeout as exc:
             raise VarietyDetailsFetchError(f"Timeout error happened trying to get details of variety: {variety}") from exc
         raise VarietyFetchError(f"Failed fetching variety details from variety: {variety} . Response status code: {raw_response.status_code}")
+
+
+class AsyncFetchVarietyDetailsUseCase:
+    """Use case for fetching variety details without blocking the event loop."""
+
+    def __init__(self, client: PokeAPIClient, single_flight: SingleFlight) -> None:
+        """Initialize the use case with the PokeAPI client and the group coalescing identical requests."""
+        self.__client = client
+        self.__single_flight = single_flight
+
+    async def execute(self, variety: Variety) -> VarietyDetails:
+        """
+        Execute the use case to fetch variety details.
+
+        Args:
+        ----
+            variety (Variety): The variety to fetch details for.
+
+        Returns:
+        -------
+            VarietyDetails: The details of the variety.
+
+        """
+        return await self.__single_flight.do(variety.url, lambda: self.__fetch(variety))
+
+    async def __fetch(self, variety: Variety) -> VarietyDetails:
+        """Request and parse the details of a variety."""
+        try:
+            raw_response = await self.__client.get(variety.url)
+        except TimeoutError as exc:
+            raise VarietyDetailsFetchError(f"Timeout error happened trying to get details of variety: {variety}") from exc
+        except aiohttp.ClientError as exc:
+            raise VarietyDetailsFetchError(f"Connection error happened trying to get details of variety: {variety}") from exc
+        if raw_response.status_code == 200:
+            return VarietyDetails.from_json(decode_variety(raw_response.content))
+        raise VarietyFetchError(f"Failed fetching variety details from variety: {variety} . Response status code: {raw_response.status_code}")
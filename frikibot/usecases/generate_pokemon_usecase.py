@@ -4,18 +4,20 @@ import typing
 
 from discord.ext import commands
 
-from frikibot import pokemon_generator
 from frikibot.entities.pokemon import Pokemon
+from frikibot.infrastructure.pokemon_reservoir import PokemonReservoir
 
 
 class GeneratePokemonUseCase:
     """Use case for generating a random Pokémon."""
 
-    def __init__(self, context: commands.Context[typing.Any], color: str) -> None:
-        """Initialize the use case with the command context."""
+    def __init__(self, context: commands.Context[typing.Any], reservoir: PokemonReservoir) -> None:
+        """Initialize the use case with the command context and the reservoir of pre-rolled Pokémon."""
         self.__context = context
-        self.__color = color
+        self.__reservoir = reservoir
 
-    def execute(self) -> Pokemon:
-        """Execute the use case to generate a random Pokémon."""
-        return pokemon_generator.generate_random_pokemon(self.__context, self.__color)
+    async def execute(self) -> Pokemon:
+        """Execute the use case to generate a random Pokémon bound to the author of the command."""
+        pokemon = await self.__reservoir.pop()
+        pokemon.author_code = str(self.__context.author.id)
+        return pokemon
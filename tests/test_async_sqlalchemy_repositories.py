@@ -0,0 +1,49 @@
+"""Tests for the asynchronous SQLAlchemy repositories."""
+
+import asyncio
+from pathlib import Path
+
+import sqlalchemy
+
+from frikibot.db.models.pokemon import Pokemon
+from frikibot.infrastructure import database
+from frikibot.infrastructure.async_sqlalchemy_pokemon_repository import AsyncSQLAlchemyPokemonRepository
+from frikibot.infrastructure.async_sqlalchemy_trainer_repository import AsyncSQLAlchemyTrainerRepository
+from frikibot.infrastructure.known_trainer_codes import KnownTrainerCodes
+
+
+def test_async_repositories_round_trip(tmp_path: Path) -> None:
+    """Trainers are upserted once and Pokémon pages seek by id, without blocking the loop."""
+    path = str(tmp_path / "pokemon.db")
+    database.Base.metadata.create_all(sqlalchemy.create_engine(f"sqlite:///{path}"))
+
+    async def scenario() -> tuple[list[str], int, list[str], list[str]]:
+        engine = database.create_async_sqlite_engine(path)
+        sessions = database.async_sessionmaker(engine, expire_on_commit=False)
+        async with sessions() as session:
+            trainers = AsyncSQLAlchemyTrainerRepository(session, KnownTrainerCodes())
+            await trainers.upsert("1", "ash")
+            await AsyncSQLAlchemyTrainerRepository(session, KnownTrainerCodes()).upsert("1", "gary")
+            trainer = await trainers.get_by_code("1")
+
+            repository = AsyncSQLAlchemyPokemonRepository(session)
+            for index in range(7):
+                await repository.add(Pokemon(name=f"pokemon-{index}", author_code="1", moves="tackle"))
+            first_page = await repository.get_page_after("1", None, 5)
+            last_page = await repository.get_page_before("1", None, 2)
+            count = await repository.count_by_trainer("1")
+        await engine.dispose()
+        assert trainer is not None
+        return (
+            [trainer.trainer_name],
+            count,
+            [pokemon.name for pokemon in first_page],
+            [pokemon.name for pokemon in last_page],
+        )
+
+    trainer_names, count, first_page, last_page = asyncio.run(scenario())
+
+    assert trainer_names == ["ash"]
+    assert count == 7
+    assert first_page == [f"pokemon-{index}" for index in range(5)]
+    assert last_page == ["pokemon-5", "pokemon-6"]
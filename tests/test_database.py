@@ -0,0 +1,25 @@
+"""Tests for the database profile."""
+
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+
+from frikibot.infrastructure import database
+
+
+def test_engines_apply_the_production_pragmas(tmp_path: Path) -> None:
+    """Writer connections use WAL and NORMAL sync, reader connections reject writes."""
+    path = str(tmp_path / "pokemon.db")
+    writer = database.create_sqlite_engine(path)
+    reader = database.create_sqlite_engine(path, read_only=True, pool_size=2)
+
+    with writer.begin() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+        synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+        connection.exec_driver_sql("CREATE TABLE roll (id INTEGER PRIMARY KEY)")
+
+    assert journal_mode == "wal"
+    assert synchronous == 1
+    with reader.connect() as connection, pytest.raises(sqlalchemy.exc.OperationalError):
+        connection.exec_driver_sql("INSERT INTO roll DEFAULT VALUES")
@@ -0,0 +1,75 @@
+"""Tests for the offline PokeAPI dataset."""
+
+import asyncio
+import json
+
+from frikibot.controller.offline_pokeapi_controller import OfflinePokeAPIController
+from frikibot.dataset.__main__ import main
+from frikibot.dataset.builder import build_reference_store
+from frikibot.dataset.sources import DumpSource
+from frikibot.infrastructure.reference_store import ReferenceStore
+
+
+def write_resource(root, path, data):
+    folder = root / "api" / "v2" / path
+    folder.mkdir(parents=True)
+    (folder / "index.json").write_text(json.dumps(data))
+
+
+def make_dump(root):
+    write_resource(
+        root,
+        "pokemon-species/1",
+        {"name": "bulbasaur", "varieties": [{"is_default": True, "pokemon": {"name": "bulbasaur", "url": "/api/v2/pokemon/1/"}}]},
+    )
+    write_resource(
+        root,
+        "pokemon/1",
+        {
+            "name": "bulbasaur",
+            "is_default": True,
+            "species": {"url": "/api/v2/pokemon-species/1/"},
+            "abilities": [{"ability": {"name": "overgrow", "url": "/api/v2/ability/65/"}, "is_hidden": False, "slot": 1}],
+            "moves": [{"move": {"name": "tackle", "url": "/api/v2/move/33/"}, "version_group_details": [{"level_learned_at": 1}]}],
+            "stats": [{"base_stat": 45, "effort": 0, "stat": {"name": "hp"}}],
+            "types": [{"slot": 1, "type": {"name": "grass"}}],
+            "sprites": {"front_default": "front.png", "other": {"official-artwork": {"front_default": "art.png", "front_shiny": "shiny.png"}}},
+        },
+    )
+    write_resource(root, "nature/3", {"name": "adamant", "decreased_stat": {"name": "special-attack"}, "increased_stat": {"name": "attack"}})
+
+
+def test_build_reference_store_from_dump(tmp_path):
+    make_dump(tmp_path / "dump")
+    store = ReferenceStore(str(tmp_path / "reference.db"))
+
+    report = build_reference_store(DumpSource(tmp_path / "dump"), store, max_index=2)
+
+    assert (report.species, report.varieties, report.natures) == (1, 1, 1)
+    assert report.missing == ["pokemon-species/2"]
+    assert store.get_ids("nature") == [3]
+    assert "version_group_details" not in store.get("pokemon/1")["moves"][0]
+
+
+def test_offline_controller_reads_only_from_store(tmp_path):
+    make_dump(tmp_path / "dump")
+    store = ReferenceStore(str(tmp_path / "reference.db"))
+    build_reference_store(DumpSource(tmp_path / "dump"), store, max_index=1)
+    controller = OfflinePokeAPIController(store)
+
+    varieties = asyncio.run(controller.fetch_pokemon_varieties(1))
+    details = asyncio.run(controller.fetch_variety_details(varieties[0]))
+    nature = asyncio.run(controller.fetch_random_nature())
+
+    assert details.name == "bulbasaur"
+    assert details.get_official_artwork_sprite("shiny") == "shiny.png"
+    assert nature.name == "adamant"
+
+
+def test_build_command(tmp_path):
+    make_dump(tmp_path / "dump")
+
+    exit_code = main(["build", "--source", str(tmp_path / "dump"), "--output", str(tmp_path / "reference.db"), "--max-index", "1"])
+
+    assert exit_code == 0
+    assert ReferenceStore(str(tmp_path / "reference.db")).get("pokemon-species/1") is not None
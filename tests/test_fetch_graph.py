@@ -0,0 +1,62 @@
+"""Tests for FetchGraph."""
+
+import asyncio
+import time
+
+import pytest
+
+from frikibot.shared.fetch_graph import FetchGraph
+
+
+async def slow(value, delay=0.05):
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_independent_fetches_run_concurrently():
+    graph = FetchGraph("test").add("a", lambda: slow("a")).add("b", lambda: slow("b")).add("c", lambda: slow("c"))
+
+    started_at = time.perf_counter()
+    results = asyncio.run(graph.run())
+
+    assert results == {"a": "a", "b": "b", "c": "c"}
+    assert time.perf_counter() - started_at < 0.12
+
+
+def test_dependencies_receive_results_and_define_critical_path():
+    graph = (
+        FetchGraph("test")
+        .add("species", lambda: slow([1, 2]))
+        .add("variety", lambda species: slow(sum(species)), depends_on=("species",))
+        .add("nature", lambda: slow("adamant", delay=0.01))
+    )
+
+    results = asyncio.run(graph.run())
+
+    assert results["variety"] == 3
+    assert graph.critical_path() == ["species", "variety"]
+
+
+def test_first_error_is_raised_and_pending_fetches_are_cancelled():
+    cancelled = []
+
+    async def failing():
+        raise ValueError("boom")
+
+    async def pending():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    graph = FetchGraph("test").add("failing", failing).add("pending", pending)
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(graph.run())
+    assert cancelled == [True]
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError, match="unknown"):
+        FetchGraph("test").add("variety", lambda species: slow(species), depends_on=("species",))
@@ -0,0 +1,66 @@
+"""Tests for the generation executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from frikibot.infrastructure.generation_executor import GenerationExecutor
+from frikibot.shared.exceptions import GenerationQueueFullError, GenerationTimeoutError
+
+
+def test_run_returns_result_off_the_event_loop() -> None:
+    """Functions run in a worker thread and their result is returned."""
+
+    async def scenario() -> tuple[int, str]:
+        executor = GenerationExecutor(workers=2, queue_size=4, deadline=1)
+        result = await executor.run(lambda a, b: (a + b, threading.current_thread().name), 1, 2)
+        await executor.shutdown()
+        return result
+
+    total, thread_name = asyncio.run(scenario())
+
+    assert total == 3
+    assert thread_name.startswith("generation")
+
+
+def test_run_times_out_and_counts_it() -> None:
+    """Tasks exceeding the deadline raise GenerationTimeoutError."""
+    release = threading.Event()
+
+    async def scenario() -> GenerationExecutor:
+        executor = GenerationExecutor(workers=1, queue_size=4, deadline=0.05)
+        with pytest.raises(GenerationTimeoutError):
+            await executor.run(release.wait, 1)
+        release.set()
+        await executor.shutdown()
+        return executor
+
+    executor = asyncio.run(scenario())
+
+    assert executor.stats.timed_out == 1
+    assert executor.stats.queue_depth == 0
+
+
+def test_run_rejects_when_queue_is_full() -> None:
+    """Tasks beyond the queue bound are rejected instead of piling up."""
+    release = threading.Event()
+
+    async def scenario() -> GenerationExecutor:
+        executor = GenerationExecutor(workers=1, queue_size=1, deadline=1)
+        running = asyncio.ensure_future(executor.run(release.wait, 1))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.ensure_future(executor.run(lambda: None))
+        await asyncio.sleep(0)
+        with pytest.raises(GenerationQueueFullError):
+            await executor.run(lambda: None)
+        release.set()
+        await asyncio.gather(running, waiting)
+        await executor.shutdown()
+        return executor
+
+    executor = asyncio.run(scenario())
+
+    assert executor.stats.rejected == 1
+    assert executor.stats.completed == 2
+    assert executor.stats.max_queue_depth == 1
@@ -0,0 +1,37 @@
+"""Tests for the Alembic migrations."""
+
+from pathlib import Path
+
+import sqlalchemy
+
+from alembic import command
+from alembic.config import Config
+
+ALEMBIC_DIRECTORY = Path(__file__).parent.parent / "alembic"
+
+
+def test_pack_moves_migration_backfills_and_reverts(tmp_path: Path) -> None:
+    """Legacy rows get their moves packed on upgrade and unpacked on downgrade."""
+    url = f"sqlite:///{tmp_path / 'pokemon.db'}"
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIRECTORY))
+    config.set_main_option("sqlalchemy.url", url)
+    engine = sqlalchemy.create_engine(url)
+
+    command.upgrade(config, "7a398109b1f2")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("INSERT INTO pokemon (name, author_code, move1, move2) VALUES ('ditto', '1', 'transform', 'tackle')")
+        connection.exec_driver_sql("INSERT INTO pokemon (name, author_code) VALUES ('magikarp', '1')")
+
+    command.upgrade(config, "3f1e6b2a9d40")
+    with engine.connect() as connection:
+        packed = connection.exec_driver_sql("SELECT name, moves FROM pokemon ORDER BY id").all()
+        indexes = connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'pokemon'").scalars().all()
+
+    command.downgrade(config, "7a398109b1f2")
+    with engine.connect() as connection:
+        unpacked = connection.exec_driver_sql("SELECT name, move1, move2, move3 FROM pokemon ORDER BY id").all()
+
+    assert packed == [("ditto", "transform,tackle"), ("magikarp", "")]
+    assert indexes == ["ix_pokemon_author_code_id"]
+    assert unpacked == [("ditto", "transform", "tackle", None), ("magikarp", None, None, None)]
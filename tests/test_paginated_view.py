@@ -0,0 +1,79 @@
+"""Tests for the paginated -dex view."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from frikibot.db.models.pokemon import Pokemon
+from frikibot.infrastructure import database
+from frikibot.infrastructure.generation_executor import GenerationExecutor
+from frikibot.infrastructure.paginated_view import PaginatedView
+from frikibot.infrastructure.write_behind_pokemon_repository import WriteBehindPokemonRepository
+
+
+class FakeMessage:
+    """Message recording the names shown on every edit."""
+
+    def __init__(self) -> None:
+        """Initialize without edits."""
+        self.pages: list[list[str]] = []
+
+    async def edit(self, embed, view) -> None:  # noqa: ANN001, ARG002
+        """Record the names of the fields of the embed."""
+        self.pages.append([field.name for field in embed.fields])
+
+
+class FakeContext:
+    """Context whose messages are FakeMessages."""
+
+    def __init__(self) -> None:
+        """Initialize with a single message."""
+        self.message = FakeMessage()
+
+    async def send(self, view) -> FakeMessage:  # noqa: ANN001, ARG002
+        """Return the recording message."""
+        return self.message
+
+
+@pytest.fixture()
+def engine(tmp_path: Path) -> Engine:
+    """Engine of a database where trainer 1 owns 12 Pokémon and trainer 2 owns one."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'pokemon.db'}")
+    database.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for index in range(12):
+            session.add(Pokemon(name=f"pokemon-{index}", author_code="1", moves="tackle"))
+            if index == 5:
+                session.add(Pokemon(name="other", author_code="2", moves="tackle"))
+        session.commit()
+    return engine
+
+
+def test_view_navigates_pages_with_keyset_queries(engine: Engine) -> None:
+    """Every button shows the right page, loading only the page shown and its neighbours."""
+    repository = WriteBehindPokemonRepository(engine)
+    context = FakeContext()
+
+    async def scenario() -> PaginatedView:
+        executor = GenerationExecutor(workers=2)
+        view = PaginatedView(repository, "1", "ash", executor)
+        await view.send(context)  # type: ignore[arg-type]
+        await view.show_page(view.current_page + 1)
+        await view.show_page(view.page_count)
+        await view.show_page(view.current_page - 1)
+        await view.show_page(view.current_page + 5)
+        await view.show_page(1)
+        await executor.shutdown()
+        return view
+
+    view = asyncio.run(scenario())
+
+    assert view.count == 12
+    assert view.page_count == 3
+    assert [page[0] for page in context.message.pages] == ["Pokemon 0", "Pokemon 5", "Pokemon 10", "Pokemon 5", "Pokemon 10", "Pokemon 0"]
+    assert context.message.pages[2] == ["Pokemon 10", "Pokemon 11"]
+    assert view.loaded_pages == [1, 2]
@@ -0,0 +1,74 @@
+"""Tests for PokeAPICache."""
+
+import asyncio
+
+from frikibot.infrastructure.pokeapi_cache import PokeAPICache
+from frikibot.infrastructure.pokeapi_client import PokeAPIClient
+from frikibot.shared.pokeapi_urls import get_endpoint, get_resource_path
+
+NATURE_URL = "https://pokeapi.co/api/v2/nature/3/"
+
+
+def test_get_endpoint():
+    assert get_endpoint(NATURE_URL) == "nature"
+    assert get_endpoint("https://pokeapi.co/api/v2/pokemon-species/447/") == "pokemon-species"
+    assert get_endpoint("https://example.com/") == ""
+
+
+def test_get_resource_path():
+    assert get_resource_path(NATURE_URL) == "nature/3"
+    assert get_resource_path("/api/v2/pokemon/447/") == "pokemon/447"
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = PokeAPICache(str(tmp_path / "cache.db"))
+    cache.put(NATURE_URL, b'{"name": "adamant"}', etag='"abc"')
+
+    cached = cache.get(NATURE_URL)
+
+    assert cached is not None
+    assert cached.content == b'{"name": "adamant"}'
+    assert cached.is_fresh
+    assert cached.conditional_headers() == {"If-None-Match": '"abc"'}
+    assert cache.stats.bytes_stored > 0
+
+
+def test_unknown_url_is_not_cached(tmp_path):
+    cache = PokeAPICache(str(tmp_path / "cache.db"))
+
+    assert cache.get(NATURE_URL) is None
+
+
+def test_response_expires_with_endpoint_ttl(tmp_path):
+    cache = PokeAPICache(str(tmp_path / "cache.db"), ttl={"nature": -1})
+    cache.put(NATURE_URL, b"{}")
+
+    cached = cache.get(NATURE_URL)
+
+    assert cached is not None
+    assert not cached.is_fresh
+
+
+def test_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = PokeAPICache(path)
+    cache.put(NATURE_URL, b"{}")
+    cache.close()
+
+    cached = PokeAPICache(path).get(NATURE_URL)
+
+    assert cached is not None
+    assert cached.content == b"{}"
+
+
+def test_client_serves_fresh_response_without_network(tmp_path):
+    cache = PokeAPICache(str(tmp_path / "cache.db"))
+    cache.put(NATURE_URL, b'{"name": "adamant"}')
+    client = PokeAPIClient(cache=cache)
+
+    response = asyncio.run(client.get(NATURE_URL))
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "adamant"}
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 0
@@ -1,12 +1,17 @@
 """Tests for PokeAPIController."""
 
-from unittest.mock import Mock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
+import aiohttp
 import pytest
 
-from frikibot.controller.pokeapi_controller import PokeAPIController
+from frikibot.controller.pokeapi_controller import AsyncPokeAPIController, PokeAPIController
 from frikibot.entities.variety import Variety
-from frikibot.shared.exceptions import VarietyDetailsFetchError, VarietyFetchError
+from frikibot.infrastructure.pokeapi_client import PokeAPIResponse
+from frikibot.shared.exceptions import NatureFetchError, VarietyDetailsFetchError, VarietyFetchError
+from frikibot.shared.pokeapi_projection import decode_variety, project_variety
 
 
 @pytest.fixture
@@ -88,11 +93,11 @@ def test_fetch_variety_details_success(mock_get, controller, mock_variety, mock_
     assert variety_details.is_default == mock_detailed_variety_response["is_default"]
     assert variety_details.name == mock_detailed_variety_response["name"]
     assert variety_details.url == mock_detailed_variety_response["species"]["url"]
-    assert variety_details.available_abilities == mock_detailed_variety_response["abilities"]
-    assert variety_details.available_moves == mock_detailed_variety_response["moves"]
-    assert variety_details.combat_stats == mock_detailed_variety_response["stats"]
-    assert variety_details.types == mock_detailed_variety_response["types"]
-    assert variety_details.available_sprites == mock_detailed_variety_response["sprites"]
+    assert variety_details.available_abilities == ("steadfast", "inner-focus", "prankster")
+    assert variety_details.available_moves == ("pound",)
+    assert variety_details.stats == (40, 70, 40, 35, 40, 60)
+    assert variety_details.types == ("fighting",)
+    assert variety_details.get_official_artwork_sprite("default") == mock_detailed_variety_response["sprites"]["other"]["official-artwork"]["front_default"]
 
 
 @patch("requests.get")
@@ -133,3 +138,116 @@ def test_fetch_variety_details_non_200_status(mock_get, controller, mock_variety
 
     assert "Failed fetching variety details from variety" in str(exc_info.value)
     assert "Response status code: 404" in str(exc_info.value)
+
+
+@pytest.fixture
+def mock_client():
+    """Fixture to create a mock PokeAPIClient."""
+    client = Mock()
+    client.get = AsyncMock()
+    return client
+
+
+def test_async_fetch_variety_details_success(mock_client, mock_variety, mock_detailed_variety_response):
+    """Test successful fetch of variety details through the async controller."""
+    mock_client.get.return_value = PokeAPIResponse(200, json.dumps(mock_detailed_variety_response).encode())
+
+    variety_details = asyncio.run(AsyncPokeAPIController(mock_client).fetch_variety_details(mock_variety))
+
+    mock_client.get.assert_awaited_once_with(mock_variety.url)
+    assert variety_details.name == mock_detailed_variety_response["name"]
+    assert variety_details.types == ("fighting",)
+    assert variety_details.get_official_artwork_sprite("shiny") == mock_detailed_variety_response["sprites"]["other"]["official-artwork"]["front_shiny"]
+
+
+def test_async_fetch_pokemon_varieties_success(mock_client):
+    """Test successful fetch of the varieties of a species through the async controller."""
+    species = {"varieties": [{"is_default": True, "pokemon": {"name": "riolu", "url": "https://pokeapi.co/api/v2/pokemon/447/"}}]}
+    mock_client.get.return_value = PokeAPIResponse(200, json.dumps(species).encode())
+
+    varieties = asyncio.run(AsyncPokeAPIController(mock_client).fetch_pokemon_varieties(447))
+
+    mock_client.get.assert_awaited_once_with("https://pokeapi.co/api/v2/pokemon-species/447/")
+    assert [variety.name for variety in varieties] == ["riolu"]
+
+
+def test_async_fetch_variety_details_connection_error(mock_client, mock_variety):
+    """Test that VarietyDetailsFetchError is raised on a client connection error."""
+    mock_client.get.side_effect = aiohttp.ClientConnectionError()
+
+    with pytest.raises(VarietyDetailsFetchError) as exc_info:
+        asyncio.run(AsyncPokeAPIController(mock_client).fetch_variety_details(mock_variety))
+
+    assert "Connection error happened trying to get details of variety" in str(exc_info.value)
+
+
+def test_async_fetch_variety_details_timeout_error(mock_client, mock_variety):
+    """Test that VarietyDetailsFetchError is raised on timeout."""
+    mock_client.get.side_effect = aiohttp.ServerTimeoutError()
+
+    with pytest.raises(VarietyDetailsFetchError) as exc_info:
+        asyncio.run(AsyncPokeAPIController(mock_client).fetch_variety_details(mock_variety))
+
+    assert "Timeout error happened trying to get details of variety" in str(exc_info.value)
+
+
+def test_async_fetch_random_nature_non_200_status(mock_client):
+    """Test that NatureFetchError is raised when status code is not 200."""
+    mock_client.get.return_value = PokeAPIResponse(503, b"")
+
+    with pytest.raises(NatureFetchError) as exc_info:
+        asyncio.run(AsyncPokeAPIController(mock_client).fetch_random_nature())
+
+    assert "Response status code: 503" in str(exc_info.value)
+
+
+def test_async_concurrent_identical_requests_are_coalesced(mock_client, mock_variety, mock_detailed_variety_response):
+    """Test that concurrent requests for the same URL share a single request and its parsed result."""
+
+    async def slow_get(_url):
+        await asyncio.sleep(0.01)
+        return PokeAPIResponse(200, json.dumps(mock_detailed_variety_response).encode())
+
+    mock_client.get.side_effect = slow_get
+    controller = AsyncPokeAPIController(mock_client)
+
+    async def roll_twice():
+        return await asyncio.gather(controller.fetch_variety_details(mock_variety), controller.fetch_variety_details(mock_variety))
+
+    first, second = asyncio.run(roll_twice())
+
+    mock_client.get.assert_awaited_once_with(mock_variety.url)
+    assert first is second
+    assert controller.single_flight.stats.shared == 1
+
+
+def test_async_coalesced_requests_share_errors(mock_client, mock_variety):
+    """Test that every caller joined to a failing request receives its error."""
+
+    async def failing_get(_url):
+        await asyncio.sleep(0.01)
+        raise aiohttp.ClientConnectionError
+
+    mock_client.get.side_effect = failing_get
+    controller = AsyncPokeAPIController(mock_client)
+
+    async def roll_twice():
+        return await asyncio.gather(
+            controller.fetch_variety_details(mock_variety),
+            controller.fetch_variety_details(mock_variety),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(roll_twice())
+
+    assert all(isinstance(result, VarietyDetailsFetchError) for result in results)
+    assert mock_client.get.await_count == 1
+
+
+def test_decode_variety_matches_projection_of_whole_document(mock_detailed_variety_response):
+    """Test that cutting unused arrays before decoding keeps every projected field."""
+    mock_detailed_variety_response["moves"][0]["version_group_details"] = [{"level_learned_at": 1, "version_group": {"name": "red-blue"}}]
+    mock_detailed_variety_response["game_indices"] = [{"game_index": 447, "version": {"name": "diamond"}}]
+    content = json.dumps(mock_detailed_variety_response).encode()
+
+    assert decode_variety(content) == project_variety(json.loads(content))
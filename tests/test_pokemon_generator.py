@@ -1,5 +1,8 @@
+import dataclasses
 from unittest.mock import MagicMock
 
+import pytest
+
 from frikibot.entities.nature import Nature
 from frikibot.entities.pokemon import Pokemon
 from frikibot.entities.stats import Stats
@@ -20,15 +23,10 @@ class PokemonBuilder:
         self.first_type = "water"
         self.second_type = None
         self.author_code = "some_code"
-        self.available_abilities = [{"ability": {"name": "A"}}]
-        self.available_moves = [
-            {"move": {"name": "A"}},
-            {"move": {"name": "B"}},
-            {"move": {"name": "C"}},
-            {"move": {"name": "D"}},
-        ]
-
-        self.stats = Stats(
+        self.available_abilities = ("A",)
+        self.available_moves = ("A", "B", "C", "D")
+
+        self.stats = Stats.from_json(
             [
                 {"base_stat": 0},
                 {"base_stat": 0},
@@ -48,8 +46,7 @@ class PokemonBuilder:
 
     def with_nature(self, nature: Nature) -> "PokemonBuilder":
         self.nature = nature
-        self.stats.decreased = nature.decreased
-        self.stats.increased = nature.increased
+        self.stats = Stats(self.stats.base, nature.decreased, nature.increased)
         return self
 
     def build(self) -> Pokemon:
@@ -136,7 +133,7 @@ def test_get_pokemon_stats():
     fake_pokemon = (
         PokemonBuilder()
         .with_stats(
-            Stats([
+            Stats.from_json([
                 {"base_stat": 70},
                 {"base_stat": 110},
                 {"base_stat": 70},
@@ -178,3 +175,23 @@ def test_sprite_should_be_official_artwork():
     pokemon = PokemonBuilder().build()
     if pokemon.sprite is not None:
         assert "official-artwork" in pokemon.sprite
+
+
+def test_pokemon_with_less_than_four_moves():
+    builder = PokemonBuilder()
+    builder.available_moves = ("transform", "transform")
+    pokemon = builder.build()
+
+    assert pokemon.moves_list == ["transform"]
+    orm = pokemon.to_orm()
+    assert orm.moves == "transform"
+    assert orm.moves_list == ["transform"]
+
+
+def test_value_objects_are_immutable():
+    pokemon = PokemonBuilder().build()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pokemon.stats.decreased = "attack"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pokemon.nature.name = "adamant"
@@ -0,0 +1,88 @@
+"""Tests for PokemonReservoir."""
+
+import asyncio
+import itertools
+
+from frikibot.infrastructure.pokemon_reservoir import PokemonReservoir
+from frikibot.shared.exceptions import NatureFetchError
+
+
+class FakeRoller:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.counter = itertools.count()
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return next(self.counter)
+
+
+def test_reservoir_fills_up_to_size_respecting_concurrency():
+    roller = FakeRoller(delay=0.01)
+
+    async def scenario():
+        reservoir = PokemonReservoir(roller, size=5, concurrency=2)
+        reservoir.start()
+        await asyncio.sleep(0.1)
+        await reservoir.stop()
+        return reservoir
+
+    reservoir = asyncio.run(scenario())
+
+    assert len(reservoir) == 5
+    assert roller.max_running == 2
+    assert reservoir.stats.refills == 5
+
+
+def test_pop_serves_pre_rolled_pokemon_and_refills():
+    roller = FakeRoller()
+
+    async def scenario():
+        reservoir = PokemonReservoir(roller, size=2, concurrency=1)
+        reservoir.start()
+        await asyncio.sleep(0.01)
+        popped = await reservoir.pop()
+        await asyncio.sleep(0.01)
+        await reservoir.stop()
+        return reservoir, popped
+
+    reservoir, popped = asyncio.run(scenario())
+
+    assert popped == 0
+    assert reservoir.stats.underruns == 0
+    assert len(reservoir) == 2
+
+
+def test_empty_reservoir_rolls_on_demand():
+    async def scenario():
+        reservoir = PokemonReservoir(FakeRoller(), size=0)
+        popped = await reservoir.pop()
+        return reservoir, popped
+
+    reservoir, popped = asyncio.run(scenario())
+
+    assert popped == 0
+    assert reservoir.stats.underruns == 1
+    assert reservoir.stats.served == 1
+
+
+def test_failed_refills_are_counted():
+    async def failing_roll():
+        raise NatureFetchError("PokeAPI is down")
+
+    async def scenario():
+        reservoir = PokemonReservoir(failing_roll, size=3, concurrency=3)
+        reservoir.start()
+        await asyncio.sleep(0.01)
+        await reservoir.stop()
+        return reservoir
+
+    reservoir = asyncio.run(scenario())
+
+    assert len(reservoir) == 0
+    assert reservoir.stats.refill_failures == 3
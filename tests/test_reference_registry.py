@@ -0,0 +1,67 @@
+"""Tests for ReferenceRegistry."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from frikibot.entities.nature import Nature
+from frikibot.infrastructure.reference_registry import ReferenceRegistry
+from frikibot.shared.exceptions import NatureFetchError
+from frikibot.shared.global_variables import MAX_INDEX
+
+ADAMANT = Nature(name="adamant", decreased="special-attack", increased="attack")
+HARDY = Nature(name="hardy", decreased=None, increased=None)
+
+
+@pytest.fixture()
+def source():
+    source = Mock()
+    source.fetch_natures = AsyncMock(return_value=[ADAMANT])
+    source.fetch_species_count = AsyncMock(return_value=3)
+    source.fetch_random_nature = AsyncMock(return_value=HARDY)
+    return source
+
+
+def test_registry_falls_back_to_source_before_loading(source):
+    registry = ReferenceRegistry(source)
+
+    nature = asyncio.run(registry.random_nature())
+
+    assert nature == HARDY
+    assert registry.species_count == MAX_INDEX
+
+
+def test_registry_serves_loaded_data_from_memory(source):
+    registry = ReferenceRegistry(source)
+    asyncio.run(registry.load())
+
+    natures = {asyncio.run(registry.random_nature()).name for _ in range(5)}
+    indices = {registry.random_species_index() for _ in range(100)}
+
+    assert natures == {"adamant"}
+    assert indices == {1, 2, 3}
+    source.fetch_random_nature.assert_not_awaited()
+
+
+def test_failed_refresh_keeps_loaded_data(source):
+    registry = ReferenceRegistry(source)
+    asyncio.run(registry.load())
+    source.fetch_natures.side_effect = NatureFetchError("PokeAPI is down")
+
+    asyncio.run(registry.load())
+
+    assert registry.natures == (ADAMANT,)
+    assert registry.species_count == 3
+
+
+def test_registry_refreshes_in_background(source):
+    async def scenario():
+        registry = ReferenceRegistry(source, refresh_interval=0.01)
+        await registry.start()
+        await asyncio.sleep(0.05)
+        await registry.stop()
+
+    asyncio.run(scenario())
+
+    assert source.fetch_natures.await_count > 1
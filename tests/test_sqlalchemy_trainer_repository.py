@@ -0,0 +1,61 @@
+"""Tests for the SQLAlchemy trainer repository."""
+
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from frikibot.db.models.trainer import Trainer
+from frikibot.infrastructure import database
+from frikibot.infrastructure.known_trainer_codes import KnownTrainerCodes
+from frikibot.infrastructure.sqlalchemy_trainer_repository import SQLAlchemyTrainerRepository
+
+
+@pytest.fixture()
+def engine(tmp_path: Path) -> Engine:
+    """Engine of an empty database."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'pokemon.db'}")
+    database.Base.metadata.create_all(engine)
+    return engine
+
+
+def test_upsert_registers_a_trainer_once(engine: Engine) -> None:
+    """Upserting an existing code keeps the first trainer."""
+    with Session(engine) as session:
+        SQLAlchemyTrainerRepository(session, KnownTrainerCodes()).upsert("1", "ash")
+    with Session(engine) as session:
+        SQLAlchemyTrainerRepository(session, KnownTrainerCodes()).upsert("1", "gary")
+        trainers = session.query(Trainer).all()
+
+    assert [(trainer.trainer_code, trainer.trainer_name, trainer.enabled) for trainer in trainers] == [("1", "ash", True)]
+
+
+def test_upsert_of_a_known_code_makes_no_queries(engine: Engine) -> None:
+    """Codes already registered by this process are skipped without querying."""
+    statements: list[str] = []
+    sqlalchemy.event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    known_codes = KnownTrainerCodes()
+
+    with Session(engine) as session:
+        SQLAlchemyTrainerRepository(session, known_codes).upsert("1", "ash")
+        queries_on_first_roll = len(statements)
+        SQLAlchemyTrainerRepository(session, known_codes).upsert("1", "ash")
+
+    assert queries_on_first_roll == 1
+    assert len(statements) == queries_on_first_roll
+    assert known_codes.stats.hits == 1
+
+
+def test_known_codes_forget_the_least_recently_used() -> None:
+    """The set of known codes is bounded."""
+    known_codes = KnownTrainerCodes(max_size=2)
+    known_codes.add("1")
+    known_codes.add("2")
+    assert "1" in known_codes
+    known_codes.add("3")
+
+    assert "2" not in known_codes
+    assert "1" in known_codes
+    assert len(known_codes) == 2
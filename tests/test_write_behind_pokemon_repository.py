@@ -0,0 +1,86 @@
+"""Tests for the write-behind Pokémon repository."""
+
+import time
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+from sqlalchemy.engine import Engine
+
+from frikibot.db.models.pokemon import Pokemon
+from frikibot.infrastructure import database
+from frikibot.infrastructure.write_behind_pokemon_repository import WriteBehindPokemonRepository
+
+
+@pytest.fixture()
+def engine(tmp_path: Path) -> Engine:
+    """Engine of an empty database."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'pokemon.db'}")
+    database.Base.metadata.create_all(engine)
+    return engine
+
+
+def build_pokemon(author_code: str, name: str = "pikachu") -> Pokemon:
+    """Build an ORM Pokémon with two moves."""
+    return Pokemon(name=name, first_type="electric", author_code=author_code, moves="thunder,surf", nature_name="bold")
+
+
+def count_rows(engine: Engine) -> int:
+    """Count the Pokémon written to the database."""
+    with engine.connect() as connection:
+        return connection.execute(sqlalchemy.select(sqlalchemy.func.count()).select_from(Pokemon)).scalar_one()
+
+
+def test_rolls_are_written_in_batches_of_batch_size(engine: Engine) -> None:
+    """A full batch is written in a single transaction."""
+    repository = WriteBehindPokemonRepository(engine, batch_size=3, flush_interval=60)
+    repository.start()
+    for index in range(6):
+        repository.add(build_pokemon("1", f"pokemon-{index}"))
+
+    deadline = time.monotonic() + 2
+    while repository.stats.rows_written < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    repository.close()
+
+    assert count_rows(engine) == 6
+    assert repository.stats.batches == 2
+    assert repository.stats.max_batch_size == 3
+
+
+def test_rolls_are_written_after_flush_interval(engine: Engine) -> None:
+    """A partial batch is written once its oldest roll waited flush_interval."""
+    repository = WriteBehindPokemonRepository(engine, batch_size=100, flush_interval=0.05)
+    repository.start()
+    repository.add(build_pokemon("1"))
+
+    time.sleep(0.3)
+
+    assert count_rows(engine) == 1
+    repository.close()
+
+
+def test_close_writes_every_queued_roll(engine: Engine) -> None:
+    """Closing the repository writes what is still queued."""
+    repository = WriteBehindPokemonRepository(engine, batch_size=100, flush_interval=60)
+    repository.start()
+    for _ in range(5):
+        repository.add(build_pokemon("1"))
+
+    repository.close()
+
+    assert count_rows(engine) == 5
+    assert repository.stats.pending == 0
+
+
+def test_reads_see_queued_rolls(engine: Engine) -> None:
+    """Reads wait for the queued rolls of every trainer, packed moves included."""
+    repository = WriteBehindPokemonRepository(engine, batch_size=100, flush_interval=60)
+    repository.start()
+    repository.add(build_pokemon("1"))
+    repository.add(build_pokemon("2"))
+
+    collection = repository.get_all_by_trainer("1")
+    repository.close()
+
+    assert [(pokemon.name, pokemon.moves_list) for pokemon in collection] == [("pikachu", ["thunder", "surf"])]